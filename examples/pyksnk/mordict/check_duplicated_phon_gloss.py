@@ -3,20 +3,26 @@
 # - pyksnk @ https://github.com/aslemen/pyksnk
 
 import sys
-import io
 import typing
 
 import pyksnk.mordict as md
+import numpy as np
 import pandas as pd
 
 #dic: md.Dictionary
 
+# Column names, bound once
+PHON_COL = md.Phon.pandas_col_name # type: str
+CAT_COL = md.Cat.pandas_col_name # type: str
+SEM_COL = md.Sem.pandas_col_name # type: str
+GLOSS_COL = md.Gloss.pandas_col_name # type: str
+
 # ======
 # Parse MOR dictionary file(s)
 # ======
-with open("/home/twotrees12/NPCMJ/Kusunoki/dictionary/lex/entries.cut") as f:
-    dic = md.parse(f.name, f.read())
-# === END WITH f ===
+path_dic = "/home/twotrees12/NPCMJ/Kusunoki/dictionary/lex/entries.cut"
+# Positions are needed, since entries are touched by their line numbers below
+dic = md.parse(path_dic, md.read_file(path_dic), with_positions = True)
 
 # ======
 # Convert the parsed dictionary to a Pandas DataFrame
@@ -42,47 +48,75 @@ dic_pd = dic.to_dataframe() # type: pd.DataFrame
 
 #   For a more "rigid" detection, you can create a "product" column (using tuple) or a "hash" column taking all those columes into calculation beforehand and then procced to check that column.
 
-scats = dic_pd[md.Cat.pandas_col_name].apply(
-        lambda c: tuple(map(lambda kv: kv.value, c["scat"]))
-) # type: pd.Series
-
-tuple_check_dup = zip(
-    dic_pd[md.Phon.pandas_col_name],
-    scats,
-    dic_pd[md.Sem.pandas_col_name],
-) # type: typing.Iterator[tuple]
-
-dic_pd["check_dup"] = list(tuple_check_dup)
-dic_pd["touch"] = dic_pd.index.get_level_values("line").map(lambda x: x > 10000)
-
-# Grouping
-dic_pd_gr = (
-    dic_pd.groupby("check_dup")
-) # type: pd.core.groupby.generic.DataFrameGroupBy
-
-def del_redundant(df: pd.DataFrame) -> pd.DataFrame:
-    having_comp = df[md.Cat.pandas_col_name].apply(
-        lambda c: len(tuple(c["comp"]))
+#   The columns are pulled out as NumPy object arrays once
+#   so that the keys are built without going through `Series.apply`.
+scats = [
+    tuple(kv.value for kv in c["scat"])
+    for c in dic_pd[CAT_COL].to_numpy()
+] # type: typing.List[tuple]
+
+dic_pd["check_dup"] = list(
+    zip(
+        dic_pd[PHON_COL].to_numpy(),
+        scats,
+        dic_pd[SEM_COL].to_numpy(),
     )
+)
 
-    having_gloss = df[md.Gloss.pandas_col_name].apply(
-        lambda c: int(bool(c.value))
-    )
-    score = having_comp + having_gloss # type: pd.Series
-
-    df.loc[
-        (
-            df["touch"] 
-            & (score != score.max())
-        ),
-        "enabled"
-    ] = False
+dic_pd["touch"] = dic_pd.index.get_level_values("line").to_numpy() > 10000
 
-    return df
-# === END ===
+# Grouping
+#   Each composite key is factorized into an integer group code
+#   so that the per-group reduction runs on NumPy arrays
+#   instead of calling a Python function once per group.
+#   The tuples themselves are factorized (rather than their hashes)
+#   so that distinct keys never share a code.
+codes, _ = pd.factorize(
+    dic_pd["check_dup"]
+) # type: typing.Tuple[np.ndarray, pd.Index]
 
 # scoring entries, keeping the highest one and discard the others
-dic_discard_redundants = dic_pd_gr.apply(del_redundant) # type: pd.DataFrame
+having_comp = np.fromiter(
+    # counted without materializing the subscription into a tuple
+    (sum(1 for _ in c["comp"]) for c in dic_pd[CAT_COL].to_numpy()),
+    dtype = np.int32,
+    count = len(dic_pd)
+) # type: np.ndarray
+
+having_gloss = np.fromiter(
+    (1 if g.value else 0 for g in dic_pd[GLOSS_COL].to_numpy()),
+    dtype = np.int8,
+    count = len(dic_pd)
+) # type: np.ndarray
+
+score = having_comp + having_gloss # type: np.ndarray
+max_per_group = (
+    pd.Series(score).groupby(codes).transform("max").to_numpy()
+) # type: np.ndarray
+
+dic_pd.loc[
+    (
+        dic_pd["touch"].to_numpy()
+        & (score != max_per_group)
+    ),
+    "enabled"
+] = False
+
+dic_discard_redundants = dic_pd # type: pd.DataFrame
+
+# Note: If you would rather drop the redundant entries altogether
+#   (keeping exactly one entry per key, and losing the comments anchored to the others)
+#   than mask them by `enabled`, `drop_duplicates` does it without any grouping:
+#
+#dic_discard_redundants = dic_pd.assign(
+#    score = score
+#).sort_values(
+#    "score",
+#    kind = "stable"
+#).drop_duplicates(
+#    subset = ["check_dup"],
+#    keep = "last"
+#).sort_index()
 
 # ======
 # Dump the result
@@ -92,7 +126,4 @@ dic_discard_redundants = dic_pd_gr.apply(del_redundant) # type: pd.DataFrame
 dic.update_with_dataframe(dic_discard_redundants)
 
 # dump it to stdout
-res = io.StringIO()
-dic.dump_mordict(res)
-
-sys.stdout.write(res.getvalue())
\ No newline at end of file
+dic.dump_mordict(sys.stdout)
\ No newline at end of file
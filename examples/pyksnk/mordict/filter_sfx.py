@@ -3,7 +3,7 @@
 # - pyksnk @ https://github.com/aslemen/pyksnk
 
 import sys
-import io
+import re
 import typing
 
 import pyksnk.mordict as md
@@ -13,48 +13,35 @@ import pyksnk.mordict as md
 # ======
 # Parse MOR dictionary file(s)
 # ======
-with open("/home/twotrees12/NPCMJ/Kusunoki/dictionary/lex/closed.cut") as f:
-    dic = md.parse(f.name, f.read())
-# === END WITH f ===
+path_dic = "/home/twotrees12/NPCMJ/Kusunoki/dictionary/lex/closed.cut"
+dic = md.parse(path_dic, md.read_file(path_dic))
 
 # ======
 # Filter sfxes
 # ======
-def match_attrvalue_str(
-    attrval: md.Cat_AttrVal, 
-    value = str
-    ) -> bool:
+PAT_SFX = re.compile(r"sfx") # type: typing.Pattern
+
+def has_sfx(attrval: md.Cat_AttrVal) -> bool:
     p_value = attrval.value
-    
-    def match_attrvalue_list_item(item: typing.Any):
-        if isinstance(item, str):
-            return item.find(value) >= 0
-        else:
-            return False
-        # === END IF ===
-    # === END ===
 
     if isinstance(p_value, str):
-        return p_value.find(value) >= 0
-    elif isinstance(p_value, list):
-        return any(map(match_attrvalue_list_item, p_value))
+        return PAT_SFX.search(p_value) is not None
+    elif isinstance(p_value, tuple):
+        return any(
+            isinstance(item, str) and PAT_SFX.search(item) is not None
+            for item in p_value
+        )
     else:
         return False
     # === END IF ===
 # === END ===
 
-dic.contents = filter(
-    lambda lex: any(
-        map(
-            lambda attrval: match_attrvalue_str(attrval, "sfx"),
-            lex.cat["scat"]
-        )
-    ),
-    dic.contents
-)
+# Materialized as a list (not a lazy `filter`)
+#   so that `dic.contents` can be iterated more than once.
+dic.contents = [
+    lex for lex in dic.contents 
+    if any(has_sfx(av) for av in lex.cat["scat"])
+]
 
 # dump it to stdout
-res = io.StringIO()
-dic.dump_mordict(res)
-
-sys.stdout.write(res.getvalue())
\ No newline at end of file
+dic.dump_mordict(sys.stdout)
\ No newline at end of file
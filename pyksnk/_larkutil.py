@@ -0,0 +1,104 @@
+import typing
+
+import os
+import lark
+
+_package_dir = os.path.dirname(os.path.abspath(__file__)) # type: str
+"""
+Directory in which the LALR tables of the parsers are cached.
+"""
+
+def build_parser(cache_name: str, **options: typing.Any) -> lark.Lark:
+    """
+    Build a Lark LALR parser whose tables are cached
+        in the package directory.
+    Lark regenerates the cache by itself
+        when the grammar or its version changes.
+
+    Parameters
+    ---------
+    cache_name : str
+        Name of the cache file in the package directory.
+        Falls back to the temporary directory
+            if the package directory is not writable.
+    options
+        Keyword arguments passed on to `lark.Lark`.
+
+    Returns
+    -------
+    parser : lark.Lark
+        The parser.
+    """
+    cache_path = os.path.join(_package_dir, cache_name) # type: str
+
+    try:
+        return lark.Lark(
+            cache = (
+                cache_path
+                if os.access(_package_dir, os.W_OK)
+                else True
+            ),
+            **options
+        )
+    except OSError:
+        # Lark does not guard the writing of the cache,
+        #   which fails e.g. on an outdated cache file which is read-only
+        return lark.Lark(cache = False, **options)
+    # === END TRY ===
+# === END ===
+
+def lazy_parser(
+    cache_name: str,
+    **options: typing.Any
+) -> typing.Callable[[], lark.Lark]:
+    """
+    Make a getter of a Lark LALR parser
+        which is built at its first call by `build_parser`,
+        so that those who do not parse do not pay for it,
+        and is returned as it is at the following calls.
+
+    Parameters
+    ---------
+    cache_name : str
+        See `build_parser`.
+    options
+        See `build_parser`.
+
+    Returns
+    -------
+    get_parser : typing.Callable[[], lark.Lark]
+        The getter.
+    """
+    parser = None # type: typing.Optional[lark.Lark]
+
+    def get_parser() -> lark.Lark:
+        nonlocal parser
+
+        if parser is None:
+            parser = build_parser(cache_name, **options)
+        # === END IF ===
+
+        return parser
+    # === END ===
+
+    return get_parser
+# === END ===
+
+class Lazy_Parser:
+    """
+    A stand-in for a Lark parser which is built at its first use,
+        forwarding every attribute to the parser that `get_parser` returns.
+    Kept as the module attribute `parser` of the parsing modules
+        for backward compatibility only.
+    Deprecated: call `get_parser` of the module instead.
+    """
+    __slots__ = ("_get_parser", )
+
+    def __init__(self, get_parser: typing.Callable[[], lark.Lark]):
+        self._get_parser = get_parser
+    # === END ===
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self._get_parser(), name)
+    # === END ===
+# === END CLASS ===
@@ -2,16 +2,15 @@ import typing
 
 import itertools
 
-import pandas as pd
-import ruamel.yaml as yaml
 import sys
-import io
+import os
+import concurrent.futures
 
 import click
 
-from . import mordict
-from . import morcomb
-from . import crule
+# NOTE: Heavyweight modules (pandas, ruamel.yaml, lark and the parsers built on it)
+#   are imported inside the commands which need them,
+#   so that each command only pays for what it uses at startup.
 
 # ======
 # Commandline commands
@@ -64,6 +63,8 @@ You must specify the path to the input file, <input_file>, so that the script ca
 '-' stands for STDIN. 
 (Example: cat <path> | pyksnk morcomb to-yaml -, which is equivalent to mor2yaml <path>)
     """
+    from . import morcomb
+
     # Parsing
     parsed = (
         morcomb.parse(
@@ -94,6 +95,7 @@ You must specify the path to the input file, <input_file>, so that the script ca
 '-' stands for STDIN. 
 (Example: cat <path> | pyksnk morcomb to-yaml -, which is equivalent to mor2yaml <path>)
     """
+    from . import morcomb
 
     # Initializations
     YAML = morcomb.get_YAML_processor() # type: yaml.YAML
@@ -121,6 +123,8 @@ You must specify the path to the input file, <input_file>, so that the script ca
     metavar = "<input_file>"
 )
 def cmd_morcomb_yaml2mor(input_file):
+    from . import morcomb
+
     # Initializations
     YAML = morcomb.get_YAML_processor() # type: yaml.YAML
 
@@ -149,14 +153,20 @@ def cmd_dict(): pass
     nargs = -1,
 )
 def cmd_dict_check(dic_files):
+    from . import mordict
+
     if dic_files:
         # Just parse and dump them
-        for f in dic_files:
-            try:
-                mordict.parse_raw(f.read())
-            except Exception as e:
-                raise e
-        # === END FOR f ===
+        # The files are read in background threads
+        #   while the ones already read are being parsed.
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            for text in executor.map(lambda f: f.read(), dic_files):
+                try:
+                    mordict.parse_raw(text)
+                except Exception as e:
+                    raise e
+            # === END FOR text ===
+        # === END WITH executor ===
     else:
         # read from STDIN and dump the parse
         mordict.parse_raw(sys.stdin.read())
@@ -176,22 +186,35 @@ def cmd_dict_check(dic_files):
     #options_metavar = "<dictionary_files>"
 )
 def cmd_dict_check_dup(dic_files):
+    import pandas as pd
+    from . import mordict
+
     # dict_all: pd.DataFrame = None
 
     if dic_files:
-        dict_all = pd.concat(
-            map(
-                lambda f: mordict.parse(
-                    f.name,
-                    f.read()
-                ).to_dataframe(),
-                dic_files 
-            )
-        )
+        sources = [
+            (f.name, f.read()) for f in dic_files
+        ] # type: typing.List[typing.Tuple[str, str]]
+
+        # Parsing is CPU-bound, hence shared out to processes
+        #   unless there is only one file.
+        # Positions are needed for the DataFrame index.
+        dics = mordict.parse_many(
+            sources,
+            with_positions = True,
+            max_workers = (1 if len(sources) == 1 else None)
+        ) # type: typing.List[mordict.Dictionary]
+
+        dfs = [
+            dic.to_dataframe() for dic in dics
+        ] # type: typing.List[pd.DataFrame]
+
+        dict_all = pd.concat(dfs)
     else:
         dict_all = mordict.parse(
             "<STDIN>",
-            sys.stdin.read()
+            sys.stdin.read(),
+            with_positions = True
         ).to_dataframe()
     # === END IF ===
 
@@ -216,30 +239,58 @@ def cmd_dict_check_dup(dic_files):
     nargs = -1,
 )
 def cmd_dict_lint(path_dic_files):
+    from . import mordict
+
     if path_dic_files:
         # current_dic: mordict.Dictionary = None
 
-        for pf in path_dic_files:
-            try:
-                with open(pf, "r") as f:
+        # The next file is read in a background thread
+        #   while the current one is being parsed and rewritten.
+        # Only one file is read ahead, so that at most two are held in memory,
+        #   and the same file is never read while it is rewritten.
+        with concurrent.futures.ThreadPoolExecutor(max_workers = 1) as executor:
+            next_text = executor.submit(
+                mordict.read_file,
+                path_dic_files[0]
+            ) # type: typing.Optional[concurrent.futures.Future]
+
+            for i, pf in enumerate(path_dic_files):
+                text = (
+                    next_text.result() if next_text is not None
+                    else mordict.read_file(pf)
+                ) # type: str
+
+                pf_next = (
+                    path_dic_files[i + 1] 
+                    if i + 1 < len(path_dic_files) else None
+                ) # type: typing.Optional[str]
+
+                next_text = (
+                    executor.submit(mordict.read_file, pf_next)
+                    if pf_next and not os.path.samefile(pf_next, pf)
+                    else None # read after the rewrite
+                )
+
+                try:
                     current_dic = mordict.parse(
-                        f.name,
-                        f.read()
+                        pf,
+                        text
                     )
-                # === END WITH ===
-
-                with open(pf, "w") as f:
-                    f.write(current_dic.print_mordict())
-                # === END WITH ===
 
-            except mordict.lark.ParseError as e:
-                sys.stderr.write(
-                    "An error has occurred in the file {0}:\n".format(f.name)
-                    )
-                sys.stderr.write(str(e))
-            else: pass
-            finally: pass
-        # === END FOR pf ===
+                    # in the same encoding as `read_file` reads
+                    with open(pf, "w", encoding = "utf-8") as f:
+                        current_dic.dump_mordict(f)
+                    # === END WITH ===
+
+                except mordict.lark.ParseError as e:
+                    sys.stderr.write(
+                        "An error has occurred in the file {0}:\n".format(pf)
+                        )
+                    sys.stderr.write(str(e))
+                else: pass
+                finally: pass
+            # === END FOR pf ===
+        # === END WITH executor ===
     else:
         dict_stdin = (
             mordict.parse(
@@ -248,10 +299,7 @@ def cmd_dict_lint(path_dic_files):
             )
         ) # type: mordict.Dictionary
 
-        buf = io.StringIO() # type: io.StringIO 
-        dict_stdin.dump_mordict(buf)
-        buf.seek(0) # go back to the beginning
-        sys.stdout.writelines(iter(buf)) # write linewise
+        dict_stdin.dump_mordict(sys.stdout)
     # === END IF ===
 # === END ===
 
@@ -274,6 +322,8 @@ def cmd_crule(): pass
     metavar = "<input_file>"
 )
 def cmd_crule_uml(input_file):
+    from . import crule
+
     cr = crule.parse(input_file.read())
     cr.dump_plantuml(sys.stdout)
 # === END ===
@@ -287,6 +337,8 @@ def cmd_crule_uml(input_file):
     metavar = "<input_file>"
 )
 def cmd_crule_uml_digest(input_file):
+    from . import crule
+
     cr = crule.parse(input_file.read())
     cr.dump_plautuml_digest(sys.stdout)
 # === END ===
\ No newline at end of file
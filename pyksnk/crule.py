@@ -3,18 +3,43 @@ import typing
 import attr
 import functools
 import itertools
+import operator
 
 import io
 import re
 import random
 import lark
 
+from . import _larkutil
+
 _plantuml_rename_table = str.maketrans({
     "-": "_",
     ":": "_",
 })
 
-@attr.s(cmp = False)
+_get_rulepackages = operator.attrgetter("rulepackages")
+"""Get the destinations of a `CRULE_Clause`."""
+
+@functools.lru_cache(maxsize = None)
+def _get_name_plantuml(name: str) -> str:
+    """
+    Translate a rule name into an identifier usable in PlantUML.
+    Memoized, since the same names are referred to again and again.
+    """
+    return name.translate(_plantuml_rename_table)
+# === END ===
+
+@functools.lru_cache(maxsize = 4096)
+def _compile_regex(pattern: str) -> "_sre.SRE_Pattern":
+    """
+    Compile a regex in a variable declaration.
+    Memoized beyond the small cache of `re`,
+        since the same patterns recur across rules.
+    """
+    return re.compile(pattern)
+# === END ===
+
+@attr.s(eq = False, slots = True)
 class CRULE_Clause:
     conditions = attr.ib(
         type = typing.List[str] # tentative
@@ -28,63 +53,46 @@ class CRULE_Clause:
         type = typing.List[str]
     )
 
-    def dump_plantuml_part(self, stream: typing.TextIO, first: bool = False) -> typing.NoReturn:
-        stream.write(
-            """\
-    {cond_kw} ({cond}) then (yes)
-""".format(
-    cond_kw = "if" if first else "elseif",
-    cond = "\n".join(self.conditions)
-)
-        )
-
-        if self.rulepackages:
-            stream.write(
-                """\
-            fork
-"""
+    def list_plantuml_part(self, first: bool = False) -> typing.List[str]:
+        parts = [
+            "    {cond_kw} ({cond}) then (yes)\n".format(
+                cond_kw = "if" if first else "elseif",
+                cond = "\n".join(self.conditions)
             )
+        ] # type: typing.List[str]
 
-            stream.write(
-                """\
-        fork again
-""".join(
-    map(
-        lambda r: """\
-             :{}|
-             detach
-""".format(r),
-        self.rulepackages
-    )
-)
+        if self.rulepackages:
+            parts.append("            fork\n")
+            parts.append(
+                "        fork again\n".join(
+                    "             :{}|\n             detach\n".format(r)
+                    for r in self.rulepackages
+                )
             )
-
-            stream.write(
-            """\
-        end fork
-"""
-        )
+            parts.append("        end fork\n")
         else:
-            stream.write(
+            parts.append(
                 """\
             if (isempty(list_token)) then (yes)
                 :yield>
             endif
 """
             )
-            pass
         # === END IF ===
 
-        stream.write(
-            """\
-        end
-"""
-        )
+        parts.append("        end\n")
+
+        return parts
+    # === END ===
+
+    def dump_plantuml_part(self, stream: typing.TextIO, first: bool = False) -> typing.NoReturn:
+        # All the chunks are gathered first and then written at once
+        stream.write("".join(self.list_plantuml_part(first)))
     # === END ===
         
 # === END CLASS ===
 
-@attr.s(cmp = False)
+@attr.s(eq = False, slots = True)
 class CRULE:
     name = attr.ib(
         type = str
@@ -107,25 +115,27 @@ class CRULE:
     )
 
     def get_name_plantuml(self) -> str:
-        return self.name.translate(_plantuml_rename_table)
+        return _get_name_plantuml(self.name)
     # === END ===
 
     def dump_plantuml(self, stream: typing.TextIO) -> typing.NoReturn:
-        stream.write("""partition {name} {{
+        # All the chunks are gathered first and then written at once
+        parts = [
+            """partition {name} {{
     start
 """.format(
         name = self.get_name_plantuml(),
     )
-        )
+        ] # type: typing.List[str]
 
         if self.clauses:
-            self.clauses[0].dump_plantuml_part(stream, True)
+            parts.extend(self.clauses[0].list_plantuml_part(True))
 
             for clause in self.clauses[1:]:
-                clause.dump_plantuml_part(stream, False)
+                parts.extend(clause.list_plantuml_part(False))
             # === END FOR clause ===
 
-            stream.write("""\
+            parts.append("""\
     else
         end
     endif
@@ -143,54 +153,44 @@ class CRULE:
 #            pass
         # === END IF ===
         
-        stream.write("""end
+        parts.append("""end
 }
 """)
+
+        stream.write("".join(parts))
     # === END ===
 
     def dump_plantuml_digest(self, stream: typing.TextIO) -> typing.NoReturn:
         possible_destinations = set(
             itertools.chain.from_iterable(
-                map(
-                    lambda c: c.rulepackages,
-                    self.clauses
-                )
+                map(_get_rulepackages, self.clauses)
             )
         )
 
-        stream.writelines(
-            itertools.chain.from_iterable(
-                map(
-                    lambda dest: [
-                        #"    ",
-                        self.get_name_plantuml(),
-                        " --> ",
-                        dest.translate(_plantuml_rename_table),
-                        "\n"
-                    ],
-                    possible_destinations
-                )
-            )
-        )
+        name_uml = self.get_name_plantuml() # type: str
 
-        if not all(map(lambda c: bool(c.rulepackages), self.clauses)):
-            stream.writelines(
-                [
-                    self.get_name_plantuml(),
-                    " --> [*] \n",
-                ]
-            )
+        # All the arrows are gathered first and then written at once
+        parts = [
+            #"    " +
+            name_uml + " --> " + _get_name_plantuml(dest) + "\n"
+            for dest in possible_destinations
+        ] # type: typing.List[str]
+
+        if not all(map(_get_rulepackages, self.clauses)):
+            parts.append(name_uml + " --> [*] \n")
         # === END IF ===
+
+        stream.write("".join(parts))
     # === END ===    
 # === END CLASS ===
 
 Preamble = str
 
-@attr.s(cmp = False)
+@attr.s(eq = False, slots = True)
 class CRULE_Set:
     name = attr.ib(
         factory = lambda: "<UNTITLED>{0:0=7X}".format(
-            random.randint(1, 16^7)
+            random.getrandbits(28) # 7 hex digits
         ),
         type = str
     )
@@ -206,18 +206,18 @@ class CRULE_Set:
     )
 
     def dump_plantuml(self, stream: typing.TextIO) -> typing.NoReturn:
-        rules_start = list(
-            filter(
-                lambda r: r.ctype == "START", self.rules.values()
-            )
-        )
-        rules_non_start = list(
-            filter(
-                lambda r: r.ctype != "START", self.rules.values()
-            )
-        )
-
-        stream.write(
+        rules_start = [
+            r for r in self.rules.values() if r.ctype == "START"
+        ] # type: typing.List[CRULE]
+        rules_non_start = [
+            r for r in self.rules.values() if r.ctype != "START"
+        ] # type: typing.List[CRULE]
+
+        # The whole diagram is rendered in memory 
+        #   and then written to `stream` at once
+        buf = io.StringIO() # type: io.StringIO
+
+        buf.write(
             """\
 @startuml
 skinparam shadowing false
@@ -227,46 +227,51 @@ title {title}
 
 start
 """.format(
-    title = self.name.translate(_plantuml_rename_table)
+    title = _get_name_plantuml(self.name)
 )
         )
 
         len_rules_start = len(rules_start)
         
         if len_rules_start > 1:
-            stream.write("fork\n")
-            rules_start[0].dump_plantuml(stream)
+            buf.write("fork\n")
+            rules_start[0].dump_plantuml(buf)
 
             for rule in rules_start[1:]:
-                stream.write("fork again\n")
-                rule.dump_plantuml(stream)
+                buf.write("fork again\n")
+                rule.dump_plantuml(buf)
             # === END FOR rule ===
 
-            stream.write("end fork\n")
+            buf.write("end fork\n")
         elif len_rules_start == 1:
-            rules_start[0].dump_plantuml(stream)
+            rules_start[0].dump_plantuml(buf)
         else:
             pass
         # === END IF ===
 
-        stream.write(
+        buf.write(
 r"""
 stop
 """
         )
 
         for rule in rules_non_start:
-            rule.dump_plantuml(stream)
+            rule.dump_plantuml(buf)
         # === END FOR rule ===
 
-        stream.write(
+        buf.write(
             r"""@enduml
 """
         )
+
+        stream.write(buf.getvalue())
     # === END ===
 
     def dump_plautuml_digest(self, stream: typing.TextIO) -> typing.NoReturn:
-        stream.write(
+        # Rendered in memory and written at once, as in `dump_plantuml`
+        buf = io.StringIO() # type: io.StringIO
+
+        buf.write(
             """\
 @startuml
 skinparam shadowing false
@@ -279,15 +284,15 @@ hide empty description
 
 title {title}
 """.format(
-    title = self.name.translate(_plantuml_rename_table)
+    title = _get_name_plantuml(self.name)
 )
         )
 
         for rule in self.rules.values():
-            rule.dump_plantuml_digest(stream)
+            rule.dump_plantuml_digest(buf)
 
             if rule.ctype == "START":
-                stream.write(
+                buf.write(
                 """\
 [*] --> {rule_name}
 """.format(
@@ -297,10 +302,12 @@ title {title}
             # === END IF ===
         # === END FOR rule ===
 
-        stream.write(
+        buf.write(
             r"""@enduml
 """
         )
+
+        stream.write(buf.getvalue())
     # === END ===
 
 # === END CLASS ===
@@ -310,9 +317,10 @@ title {title}
 # ======
 class __Transformer(lark.Transformer):
     def document(self, args) -> CRULE_Set:
+        # The preambles are inlined (see `_preambles`)
         return CRULE_Set(
-            preambles = args[0],
-            rules = args[1]
+            preambles = args[:-1],
+            rules = args[-1]
         )
     # === END ===
     def rule_action_set(
@@ -330,14 +338,6 @@ class __Transformer(lark.Transformer):
         return res
     # === END ===
 
-    def rule_resultcat(
-        self,
-        args
-    ) -> str:
-        return "".join(args)
-        # tentative
-    # === END ===
-
     def rulepackages(
         self, 
         args: typing.Iterable[lark.Token]
@@ -349,7 +349,7 @@ class __Transformer(lark.Transformer):
         self, 
         args
     ) -> typing.Tuple[typing.Union[str, "_sre.SRE_Pattern"]]:
-        return (str(args[0]), re.compile(args[1]))
+        return (str(args[0]), _compile_regex(args[1].value))
     # === END ===
 
     def variable_declarations(
@@ -359,15 +359,8 @@ class __Transformer(lark.Transformer):
         return dict(args)
     # === END ===
 
-    def rule_name(self, args) -> str:
-        return "".join(args)
-    # === END ===
-
-    def rule_ctype(self, args) -> str:
-        return "".join(args)
-    # === END ===
-
     def item_rule_clause(self, args) -> CRULE_Clause:
+        # The result category is given as a bare token
         if len(args) > 2:
             rulepackages = args[2]
         else:
@@ -376,48 +369,36 @@ class __Transformer(lark.Transformer):
 
         return CRULE_Clause(
             conditions = args[0],
-            resultcat = args[1],
+            resultcat = args[1].value,
             rulepackages = rulepackages
         )
     # === END ===
 
-    def rule_clauses(
+    def rule_conditions(
         self, 
-        args: typing.List[CRULE_Clause]
-    ) -> typing.List[CRULE_Clause]:
-        return args
-    # === END ===
-
-    def item_rule_condition(self, args) -> str:
-        # tentative
-        return "".join(args)
-    # === END ===
-
-    def rule_conditions(self, args) -> typing.List[str]:
-        return args
+        args: typing.Iterable[lark.Token]
+    ) -> typing.List[str]:
+        # Each condition is given as a bare token
+        return [x.value for x in args]
     # === END ===
 
     def item_rule(self, args) -> CRULE:
+        # The name and the ctype are given as bare tokens
+        # The clauses are inlined (see `_rule_clauses`)
         return CRULE(
-            name = args[0],
-            ctype = args[1],
+            name = args[0].value,
+            ctype = args[1].value,
             variable_defs = args[2],
-            clauses = args[3],
+            clauses = args[3:],
         )
 
     def rules(self, args) -> typing.Dict[str, CRULE]:
         return {x.name : x for x in args}
     # === END ===
 
-    def item_preamble(self, args) -> str:
-        return "".join(args)
-    # === END ===
-
-    def preambles(
-        self, 
-        args: typing.List[str]
-    ) -> typing.List[str]:
-        return args
+    @lark.visitors.v_args(inline = True)
+    def item_preamble(self, preamble: lark.Token) -> str:
+        return preamble.value
     # === END ===
 
 # === END CLASS ===
@@ -439,6 +420,18 @@ REGEX:     ANYCHARS
 CTYPE: "START" | "END" | "-" | "#" | "+" | "$"
     """
 
+    # ------
+    # Keywords
+    # ------
+    r"""
+_KW_RULENAME:    "RULENAME:"
+_KW_CTYPE:       "CTYPE:"
+_KW_RESULTCAT:   "RESULTCAT"
+_KW_RULEPACKAGE: "RULEPACKAGE"
+_KW_IF:          "if"
+_KW_THEN:        "then"
+    """
+
 
     # ------
     # Linebreaks
@@ -463,6 +456,11 @@ _LINE_CONT: /\\/ _EOL
     # ======
     # Items
     # ======
+    # NOTE: Repetitions are to be written with `*` / `+`
+    #   (e.g. `rule_clauses: item_rule_clause*`), 
+    #   which Lark expands into left-recursive rules.
+    #   Never write them in the right-recursive form like `xs: x xs?`,
+    #   which makes the LALR parser keep the whole sequence on its stack.
     r"""
 variable_ref: "$" ( NAMECHAR | "(" NAMECHARS ")" )
 feature: "[" CHARS CHARS "]"
@@ -471,43 +469,43 @@ feature_name_ref: "[" CHARS "]"
     """
 
     r"""
-rule_name: "RULENAME:" NAMECHARS _PERIOD
-rule_ctype: "CTYPE:" CTYPE _PERIOD
-
 item_variable_declaration: NAMECHARS "=" REGEX _PERIOD
 variable_declarations: item_variable_declaration*
 
-item_rule_condition: ANYCHARS _PERIOD // tentative
-rule_resultcat: "RESULTCAT" "=" ANYCHARS _PERIOD // tentative
-rulepackages: "RULEPACKAGE" "=" "{" (NAMECHARS ( "," NAMECHARS )* )? "}" _PERIOD
-rule_conditions: item_rule_condition*
+rulepackages: _KW_RULEPACKAGE "=" "{" (NAMECHARS ( "," NAMECHARS )* )? "}" _PERIOD
+rule_conditions: (ANYCHARS _PERIOD)* // tentative
 
-item_rule_clause: "if" _PERIOD rule_conditions "then" _PERIOD rule_resultcat rulepackages?
-rule_clauses: item_rule_clause*
-item_rule: rule_name rule_ctype variable_declarations rule_clauses
+item_rule_clause: _KW_IF _PERIOD rule_conditions _KW_THEN _PERIOD _KW_RESULTCAT "=" ANYCHARS _PERIOD rulepackages?
+_rule_clauses: item_rule_clause*
+item_rule: _KW_RULENAME NAMECHARS _PERIOD _KW_CTYPE CTYPE _PERIOD variable_declarations _rule_clauses
     """
 
     r"""
 item_preamble: "@" ANYCHARS _PERIOD
-preambles: item_preamble*
+_preambles: item_preamble*
 rules: item_rule*
-document: preambles rules
+document: _preambles rules
     """
 )
 
-parser = lark.Lark(
+get_parser = _larkutil.lazy_parser(
+    "crule.larkcache",
     grammar = _grammar,
     start = "document",
     parser = "lalr",
-    transformer = __Transformer()
-) # type; lark.Lark
+    transformer = __Transformer(),
+) # type: typing.Callable[[], lark.Lark]
+"""
+Get the Lark parser for MOR c-rules,
+    built at the first call.
+"""
+
+parser = _larkutil.Lazy_Parser(get_parser) # type: _larkutil.Lazy_Parser
 """
-A Lark parser for MOR c-rules.
+A Lark parser for MOR c-rules, built at its first use.
+Deprecated: use `get_parser` instead.
 """
 
-# ------
-# Executor
-# ------
 def parse(text: str) -> CRULE_Set:
-    return parser.parse(text)
+    return get_parser().parse(text)
 # === END ===
\ No newline at end of file
@@ -2,18 +2,23 @@ import typing
 
 import functools
 import itertools
+import operator
 
 import lark
 import lark.indenter
 
 import ruamel.yaml as yaml
 
+from . import _larkutil
+
 # ======
 # Data classes
 # ======
 WordAnalysis = str
 
 class WordAnalysisCandidates:
+    __slots__ = ("alts", )
+
     def __init__(self, alts: typing.Iterable[WordAnalysis]):
         self.alts = list(alts)
     # === END ===
@@ -53,16 +58,24 @@ class WordAnalysisCandidates:
         gotten = constructor.construct_rt_sequence(
             node = node,
             seqtyp = yaml.comments.CommentedSeq(),
-            deep = True
+            deep = False
             )
         res.alts = gotten
     # === END ===
 
 # === END CLASS ===
 
+_EMPTY_WAC = WordAnalysisCandidates(())
+_EMPTY_WAC.alts = () # made immutable as it is shared
+"""
+The empty candidates shared by default among `Word`s.
+"""
+
 class Word:
+    __slots__ = ("mor_candidates", "comb", "penn", "ort")
+
     def __init__(self,
-        mor_candidates: WordAnalysisCandidates = WordAnalysisCandidates([]),
+        mor_candidates: WordAnalysisCandidates = _EMPTY_WAC,
         comb: str = "",
         penn: str = "",
         ort: str = ""
@@ -80,20 +93,27 @@ class Word:
         penn: typing.Iterable[str],
         ort: typing.Iterable[str],
     ) -> typing.Iterator["Word"] :
-        return (
-            Word(
-                mor_candidates = m,
-                comb = c,
-                penn = p,
-                ort = o,
-            )
+        return iter(Word.list_from_columns(mor, comb, penn, ort))
+    # === END ===
+
+    @staticmethod
+    def list_from_columns(
+        mor: typing.Iterable[WordAnalysisCandidates],
+        comb: typing.Iterable[str],
+        penn: typing.Iterable[str],
+        ort: typing.Iterable[str],
+    ) -> typing.List["Word"] :
+        # NOTE: The columns are not guaranteed to be of the same length
+        #   by the grammar, hence `zip_longest` rather than `zip`.
+        return [
+            Word(m, c, p, o)
             for m, c, p, o in itertools.zip_longest(
                 mor,
                 comb,
                 penn,
                 ort,
             )
-        )
+        ]
     # === END ===
 
     @staticmethod
@@ -105,16 +125,14 @@ class Word:
             typing.List[str]
         ]
     ]:
-        line_mor = [] # type: typing.List[WordAnalysisCandidates]
-        line_comb = [] # type: typing.List[str]
-        line_penn = [] # type: typing.List[str]
-        line_ort = [] # type: typing.List[str]
+        if not isinstance(words, list):
+            words = list(words)
+        # === END IF ===
 
-        for w in words:
-            line_mor.append(w.mor_candidates)
-            line_comb.append(w.comb)
-            line_penn.append(w.penn)
-            line_ort.append(w.ort)
+        line_mor = [w.mor_candidates for w in words] # type: typing.List[WordAnalysisCandidates]
+        line_comb = [w.comb for w in words] # type: typing.List[str]
+        line_penn = [w.penn for w in words] # type: typing.List[str]
+        line_ort = [w.ort for w in words] # type: typing.List[str]
 
         return line_mor, line_comb, line_penn, line_ort
     # === END ===
@@ -150,13 +168,13 @@ class Word:
         constructor: yaml.RoundTripConstructor, 
         node: yaml.MappingNode
         ) -> "Word":
-        res = cls([], [], [], [])
+        res = cls()
         yield res
         gotten = yaml.comments.CommentedMap()
         constructor.construct_mapping(
             node = node,
             maptyp = gotten,
-            deep = True
+            deep = False
             )
         gotten_dict = dict(gotten)
 
@@ -167,45 +185,40 @@ class Word:
     # === END ===
 # === END CLASS ===
 
+_format_sentence = """\
+*CHI:\t{chi}
+%mor:\t{mor}
+%comb:\t{comb}
+%penn:\t{penn}
+%ort:\t{ort}
+@G:\t{num}
+""".format
+"""
+Fill in the template of a sentence in a morcomb file.
+Bound once here so that `Sentence.__str__` does not look it up every time.
+"""
+
 class Sentence:
+    __slots__ = ("id_str", "chi", "words")
+
     def __init__(self,
         id_str: str               = "",
         chi:    str               = "",
-        words:  typing.List[Word] = [],
+        words:  typing.Optional[typing.List[Word]] = None,
     ):
         self.id_str = id_str
         self.chi = chi
-        self.words = words
+        self.words = [] if words is None else words
     # === END ===
 
     def __str__(self) -> str:
         m, c, p, o = Word.list_columns_from_words(self.words)
-        spacer = (
-            lambda li: " ".join(map(str, li))
-        ) # type: typing.Mapping[list, str]
-        filter_spacer = (
-            lambda li: spacer(filter(None, li))
-        ) # type: typing.Mapping[list, str]
-        tabber = (
-            lambda li: "\n\t".join(map(str, li))
-        ) # type: typing.Mapping[list, str]
-        filter_tabber = (
-            lambda li: tabber(filter(None, li))
-        ) # type: typing.Mapping[list, str]
-
-        return """\
-*CHI:\t{chi}
-%mor:\t{mor}
-%comb:\t{comb}
-%penn:\t{penn}
-%ort:\t{ort}
-@G:\t{num}
-""".format(
+        return _format_sentence(
     chi = self.chi,
-    mor = filter_tabber(m),
-    comb = filter_spacer(c),
-    penn = filter_spacer(p),
-    ort = filter_spacer(o),
+    mor = "\n\t".join(str(x) for x in m if x),
+    comb = " ".join(x for x in c if x),
+    penn = " ".join(x for x in p if x),
+    ort = " ".join(x for x in o if x),
     num = self.id_str,
 )
     # === END ===
@@ -240,7 +253,7 @@ class Sentence:
         constructor.construct_mapping(
             node = node,
             maptyp = gotten,
-            deep = True
+            deep = False
             )
         gotten_dict = dict(gotten)
 
@@ -251,30 +264,25 @@ class Sentence:
 # === END CLASS ===
 
 class Morcomb:
+    __slots__ = ("preambles", "sentences", "postambles")
+
     def __init__(self,
-        preambles:      typing.List[str] = [],
-        sentences:      typing.List[str] = [],
-        postambles:     typing.List[str] = []
+        preambles:      typing.Optional[typing.List[str]] = None,
+        sentences:      typing.Optional[typing.List[str]] = None,
+        postambles:     typing.Optional[typing.List[str]] = None
     ):
-        self.preambles = preambles
-        self.sentences = sentences
-        self.postambles = postambles
+        self.preambles = [] if preambles is None else preambles
+        self.sentences = [] if sentences is None else sentences
+        self.postambles = [] if postambles is None else postambles
     # === END ===
 
     def __str__(self) -> str:
-        def print_amble(amble: str) -> str:
-            return "@{0}\n".format(amble)
-        # === END ===
+        parts = [] # type: typing.List[str]
+        parts.extend("@" + amble + "\n" for amble in self.preambles)
+        parts.extend(map(str, self.sentences))
+        parts.extend("@" + amble + "\n" for amble in self.postambles)
 
-        return (
-            "".join(
-                itertools.chain(
-                    map(print_amble, self.preambles),
-                    map(str, self.sentences),
-                    map(print_amble, self.postambles)
-                )
-            )
-        )
+        return "".join(parts)
     # === END ===
 
     yaml_tag = "!Morcomb" # type: typing.ClassVar[str]
@@ -309,7 +317,7 @@ class Morcomb:
         constructor.construct_mapping(
             node = node,
             maptyp = gotten,
-            deep = True
+            deep = False
             )
         gotten_dict = dict(gotten)
 
@@ -348,48 +356,57 @@ class __Indenter(lark.indenter.Indenter):
     tab_len = 4 # type: int
 # === END CLASS ===
 
+_get_token_value = operator.attrgetter("value")
+"""
+Take out the plain string of a `lark.Token`.
+Tokens themselves cannot be represented in YAML, 
+    hence this conversion.
+"""
+
 # TODO: この種の変換は必ずしも必要ない（lintの場合は特にそう）ので、変換を切り出しておくとよい。
 class __Transformer(lark.Transformer):
     def start(self, args):
-        return Morcomb(*args)
-    # === END ===
-
-    def sentence_list(self, args):
-        return args
+        # The sentences are inlined (see `_sentence_list`)
+        return Morcomb(
+            preambles = args[0],
+            sentences = args[1:-1],
+            postambles = args[-1]
+        )
     # === END ===
 
     def preambles(self, args):
-        return [p.value for p in args]
+        return list(map(_get_token_value, args))
     # === END ===
 
     def postambles(self, args):
-        return [p.value for p in args]
+        return list(map(_get_token_value, args))
     # === END ===
 
     def sentence(self, args: typing.Iterator[lark.Tree]):
         res = {subtree.data:subtree.children for subtree in args}
 
-        res_words = Word.iter_from_columns(
+        res_words = Word.list_from_columns(
             res["line_mor"],
-            map(lambda x: x.value, res["line_comb"]),
-            map(lambda x: x.value, res["line_penn"]),
-            map(lambda x: x.value, res["line_ort"]),
+            map(_get_token_value, res["line_comb"]),
+            map(_get_token_value, res["line_penn"]),
+            map(_get_token_value, res["line_ort"]),
         ) # type: typing.Dict[typing.Any]
         # TODO: この手の変換はもう少しlocalにやりたい
 
         def squash_tokens(li: typing.List[lark.Token]) -> str:
-            return "".join(map(lambda x: x.value, li))
+            # Tokens are strings, hence joined as they are
+            return "".join(li)
         # === END ===
 
         return Sentence(
             id_str = squash_tokens(res["line_num"]),
             chi = squash_tokens(res["line_chi"]),
-            words = list(res_words)
+            words = res_words
         )
     # === END ===
 
     def list_mor(self, args):
-        return WordAnalysisCandidates(item.value for item in args)
+        return WordAnalysisCandidates(map(_get_token_value, args))
     # === END ===
 
 # === END CLASS ===
@@ -407,8 +424,9 @@ _grammar = (
     # ------
     r"""
 %import common.WS_INLINE -> _SPACES
-_EOL:      /(\r\n?|\r?\n)/
-_NEWLINES: (_EOL _SPACES*)+
+// One flat pattern rather than `(_EOL _SPACES*)+`,
+//   whose nested repetition would be compiled as it is
+_NEWLINES: /((\r\n?|\n)[ \t]*)+/
 %declare _INDENT _DEDENT
     """
 
@@ -459,18 +477,29 @@ postambles: item_amble*
     # Document
     # ======
     r"""
-sentence_list: sentence*
-start: _NEWLINES* preambles sentence_list postambles
+_sentence_list: sentence*
+start: _NEWLINES* preambles _sentence_list postambles
     """
 ) # type: str
 
-parser = lark.Lark(
+get_parser = _larkutil.lazy_parser(
+    "morcomb.larkcache",
     grammar = _grammar,
     parser = "lalr",
     postlex = __Indenter(),
-    transformer = __Transformer()
-) # type: lark.Lark
+    transformer = __Transformer(),
+) # type: typing.Callable[[], lark.Lark]
+"""
+Get the Lark parser for morcomb files,
+    built at the first call.
+"""
+
+parser = _larkutil.Lazy_Parser(get_parser) # type: _larkutil.Lazy_Parser
+"""
+A Lark parser for morcomb files, built at its first use.
+Deprecated: use `get_parser` instead.
+"""
 
 def parse(text: str) -> Morcomb:
-    return parser.parse(text)
+    return get_parser().parse(text)
 # === END ===
@@ -5,27 +5,79 @@ import abc
 import itertools
 import collections
 import sys
-import io
+import os
+import concurrent.futures
+import mmap
 import random
+import weakref
 
 import lark
 
-import pandas as pd
 import csv
 
+from . import _larkutil
+
+if typing.TYPE_CHECKING:
+    # imported lazily where needed as it takes long to load
+    import pandas as pd
+# === END IF ===
+
 # ======
 # Internal helper functions
 # ======
 
-# Generate a random negative integer.
-def _gen_rand_neg() -> int:
-    return (- random.randint(1, sys.maxsize))
-# === END ===
+# Generate a negative integer which is unique within the process.
+# A plain counter suffices for that, without any call of the RNG,
+#   and its bound `__next__` is called directly.
+_gen_neg_index = itertools.count(-1, -1).__next__ # type: typing.Callable[[], int]
+
+_newline_to_space_table = str.maketrans({
+    "\r": " ",
+    "\n": " ",
+})
+"""
+Translation table to flatten a serialization into a single line.
+"""
+
+_EMPTY_COMMENTS = () # type: typing.Tuple
+"""
+The empty comments shared by default.
+A tuple so that the shared instance is never mutated.
+"""
+
+class _ListBuf:
+    """
+    A write-only text buffer which just collects the written strings
+    and joins them at once in `getvalue`.
+    Lighter than `io.StringIO` for the many small writes
+        made in serializing a MOR dictionary.
+    """
+
+    __slots__ = ("_parts", )
+
+    def __init__(self):
+        self._parts = [] # type: typing.List[str]
+    # === END ===
+
+    def write(self, s: str) -> int:
+        self._parts.append(s)
+        return len(s)
+    # === END ===
+
+    def writelines(self, lines: typing.Iterable[str]) -> typing.NoReturn:
+        self._parts.extend(lines)
+    # === END ===
+
+    def getvalue(self) -> str:
+        return "".join(self._parts)
+    # === END ===
+# === END CLASS ===
 
 # ======
 # Data Types
 # ======
 @attr.s(
+    slots = True,
     #auto_attribs = True
 )
 class MorDict_Base(metaclass = abc.ABCMeta):
@@ -37,9 +89,9 @@ class MorDict_Base(metaclass = abc.ABCMeta):
     meta : lark.tree.Meta, optional
         Position of the instance is the source file.
         Defaults to `None`.
-    comments : typing.List[Comment], optional
+    comments : typing.Sequence[Comment], optional
         Comments anchored to the instance. 
-        Defaults to an empty list rather than `None`.
+        Defaults to an empty tuple rather than `None`.
 
     Notes
     -----
@@ -51,15 +103,15 @@ class MorDict_Base(metaclass = abc.ABCMeta):
     meta = attr.ib(
         cmp = False,
         kw_only = True,
-        factory = lambda: None,
+        default = None,
         type = typing.Optional[lark.tree.Meta]
     )
 
     comments = attr.ib(
         cmp = False,
         kw_only = True,
-        factory = list,
-        type = typing.List["Comment"]
+        default = _EMPTY_COMMENTS,
+        type = typing.Sequence["Comment"]
     )
 
     #delimiter_beginning: typing.ClassVar[str]
@@ -107,10 +159,9 @@ class MorDict_Base(metaclass = abc.ABCMeta):
             The resulting string.
         """
 
-        with io.StringIO() as buf:
-            self.dump_mordict(buf, with_comments)
-            return buf.getvalue()
-        # === END WITH ===
+        buf = _ListBuf() # type: _ListBuf
+        self.dump_mordict(buf, with_comments)
+        return buf.getvalue()
     # === END ===
 
     def __str__(self) -> str:
@@ -118,6 +169,13 @@ class MorDict_Base(metaclass = abc.ABCMeta):
     # === END ===
 # === END abstract CLASS ===
 
+_interned_values = weakref.WeakValueDictionary(
+) # type: typing.MutableMapping[typing.Tuple[type, typing.Hashable], MorDict_Base]
+"""
+The table behind `MorDict_SingleFixedValue.intern` and `Cat.intern`,
+    keyed by the class and the value.
+"""
+
 @attr.s(
     cmp = True,     # make this comparable
     frozen = True,  # make this immutable -> hashable
@@ -134,9 +192,9 @@ class MorDict_SingleFixedValue(MorDict_Base):
     meta : lark.tree.Meta, optional
         Position of the instance is the source file.
         Defaults to `None`.
-    comments : typing.List[Comment], optional
+    comments : typing.Sequence[Comment], optional
         Comments anchored to the instance. 
-        Defaults to an empty list rather than `None`.
+        Defaults to an empty tuple rather than `None`.
     value : str
         The value that the instance contain.
     """
@@ -150,31 +208,56 @@ class MorDict_SingleFixedValue(MorDict_Base):
     #is_omittable: typing.ClassVar[bool]
     #"""Indicates whetehr instances can be omitted in MOR dictionary files."""
 
+    @classmethod
+    def intern(cls, value: str) -> "MorDict_SingleFixedValue":
+        """
+        Get the instance of the class with the given value
+            and neither position nor comments,
+            shared among all the callers as long as it is alive.
+        Values recur a lot in dictionaries (e.g. Sem, Gloss),
+            so sharing them saves memory 
+            and lets comparisons take the identity shortcut.
+
+        Parameters
+        ----------
+        value : str
+            The value.
+
+        Returns
+        -------
+        instance : MorDict_SingleFixedValue
+            The shared instance.
+        """
+        key = (cls, value) # type: typing.Tuple[type, str]
+        res = _interned_values.get(key)
+
+        if res is None:
+            res = cls(value = value)
+            _interned_values[key] = res
+        # === END IF ===
+
+        return res
+    # === END ===
+
     def dump_mordict(
         self,
         buffer: typing.TextIO,
         with_comments: bool = True
     ) -> typing.NoReturn: 
         if (not self.is_omittable) or self.value:
-            buffer.writelines(
-                (
-                    self.delimiter_beginning,
-                    self.value,
-                    self.delimiter_end
-                )
+            buffer.write(
+                self.delimiter_beginning + self.value + self.delimiter_end
             )
         # === END IF ===
 
-        if with_comments:
-            if self.comments:
-                buffer.write(" ")
-            # === END IF ===
+        if with_comments and self.comments:
+            buffer.write(" ")
 
+            # Comments are all of the same class, 
+            #   whose method is thus looked up only once
+            dump = Comment.dump_mordict
             for c in self.comments:
-                c.dump_mordict(
-                    buffer,
-                    with_comments = True
-                )
+                dump(c, buffer, True)
             # === END FOR c ===
         # === END IF ===
     dump_mordict.__doc__ = MorDict_Base.dump_mordict.__doc__
@@ -184,6 +267,7 @@ class MorDict_SingleFixedValue(MorDict_Base):
 
 @attr.s(
     frozen = True,
+    slots = True,
 )
 class MorDict_PandasColumn(MorDict_Base):
     """
@@ -210,12 +294,13 @@ class Comment(MorDict_SingleFixedValue):
     meta : lark.tree.Meta, optional
         Position of the instance is the source file.
         Defaults to `None`.
-    comments : typing.List[Comment], optional
+    comments : typing.Sequence[Comment], optional
         Comments anchored to the instance. 
-        Defaults to an empty list rather than `None`.
+        Defaults to an empty tuple rather than `None`.
     value : str
         The comment.
     """
+    __slots__ = () # keep the instances free of `__dict__`
 
     delimiter_beginning = "% " # type: typing.ClassVar[str]
     delimiter_end = "\n" # type: typing.ClassVar[str]
@@ -234,18 +319,51 @@ class Phon(MorDict_SingleFixedValue, MorDict_PandasColumn):
     meta : lark.tree.Meta, optional
         Position of the instance is the source file.
         Defaults to `None`.
-    comments : typing.List[Comment], optional
+    comments : typing.Sequence[Comment], optional
         Comments anchored to the instance. 
-        Defaults to an empty list rather than `None`.
+        Defaults to an empty tuple rather than `None`.
     value : str
         The surface form.
     """
+    __slots__ = () # keep the instances free of `__dict__`
+
     delimiter_beginning = "" # type: typing.ClassVar[str]
     delimiter_end = "" # type: typing.ClassVar[str]
     pandas_col_name = "Phon" # type: typing.ClassVar[str]
     is_omittable = False # type: typing.ClassVar[bool]
 # === END CLASS ===
 
+def _freeze_attr_value(
+    value: typing.Union[str, typing.Iterable[str]]
+) -> typing.Union[str, typing.Tuple[str, ...]]:
+    """
+    Convert a multiple value of a feature into a tuple
+        so that `Cat_AttrVal` (and `Cat` thereby) can be hashed.
+    """
+    if isinstance(value, list):
+        return tuple(value)
+    else:
+        return value
+    # === END IF ===
+# === END ===
+
+class _Cat_AttrVal_Memo(MorDict_Base):
+    """
+    Slots of the memos of `Cat_AttrVal`, 
+        which are invariant as the instance is frozen.
+    Declared as plain slots rather than attrs attributes
+        so that they are left out of `attr.asdict`, `attr.astuple`
+        and pickles.
+    Each stays unset until it is first filled.
+
+    Attributes
+    ----------
+    _str_cache : str
+        Memo of the serialization (i.e. `__str__`).
+    """
+    __slots__ = ("_str_cache", )
+# === END CLASS ===
+
 @attr.s(
     cmp = True,     # make this comparable
     frozen = True,
@@ -253,7 +371,7 @@ class Phon(MorDict_SingleFixedValue, MorDict_PandasColumn):
     slots = True,
     #auto_attribs = True
 )
-class Cat_AttrVal(MorDict_Base):
+class Cat_AttrVal(_Cat_AttrVal_Memo):
     r"""
     Feature-value pair of the 
     category information of a word, 
@@ -266,13 +384,15 @@ class Cat_AttrVal(MorDict_Base):
     meta : lark.tree.Meta, optional
         Position of the instance is the source file.
         Defaults to `None`.
-    comments : typing.List[Comment], optional
+    comments : typing.Sequence[Comment], optional
         Comments anchored to the instance. 
-        Defaults to an empty list rather than `None`.
+        Defaults to an empty tuple rather than `None`.
     key : str
         The feature name.
-    value : typing.Union[str, typing.List[str]]
-        The value, either a string or a list thereof.
+    value : typing.Union[str, typing.Tuple[str, ...]]
+        The value, either a string or a tuple thereof.
+        A list given is converted into a tuple,
+            which keeps the instance hashable.
     """
     delimiter_beginning = "[" # type: typing.ClassVar[str]
     delimiter_end = "]" # type:       typing.ClassVar[str] 
@@ -285,7 +405,8 @@ class Cat_AttrVal(MorDict_Base):
     value = attr.ib(
         cmp = True,
         kw_only = True,
-        type = typing.Union[str, typing.List[str]]
+        converter = _freeze_attr_value,
+        type = typing.Union[str, typing.Tuple[str, ...]]
     )
 
     def dump_mordict(
@@ -293,24 +414,47 @@ class Cat_AttrVal(MorDict_Base):
         buffer: typing.TextIO,
         with_comments: bool = True
     ) -> typing.NoReturn:
-        buffer.writelines(
-            (
-                self.delimiter_beginning,
-                self.key,
-                " "
-            )
-        )
+        buffer.write(str(self))
+    # === END ===
 
-        if isinstance(self.value, list):
-            buffer.writelines(" ".join(self.value))
-        else:
-            buffer.write(str(self.value))
-        # === END IF ===
+    def __str__(self) -> str:
+        try:
+            return self._str_cache
+        except AttributeError:
+            # The shape of the value is checked only once
+            if isinstance(self.value, tuple):
+                value = " ".join(self.value) # type: str
+            else:
+                value = str(self.value)
+            # === END IF ===
 
-        buffer.write(self.delimiter_end)
+            res = (
+                self.delimiter_beginning + self.key + " " 
+                + value + self.delimiter_end
+            ) # type: str
+            # bypass the frozenness just for the memo
+            object.__setattr__(self, "_str_cache", res)
+
+            return res
+        # === END TRY ===
     # === END ===
 # === END CLASS ===
 
+class _Cat_Memo(MorDict_PandasColumn):
+    """
+    Slots of the memos of `Cat`, likewise (see `_Cat_AttrVal_Memo`).
+
+    Attributes
+    ----------
+    _str_cache : str
+        Memo of the serialization without comments (i.e. `__str__`).
+    _index : typing.Dict[str, typing.Tuple[Cat_AttrVal]]
+        Memo of the features grouped by their keys, 
+            built at the first subscription.
+    """
+    __slots__ = ("_str_cache", "_index")
+# === END CLASS ===
+
 @attr.s(
     cmp = True,
     frozen = True,
@@ -318,7 +462,7 @@ class Cat_AttrVal(MorDict_Base):
     slots = True,
     #auto_attribs = True
 )
-class Cat(MorDict_PandasColumn):
+class Cat(_Cat_Memo):
     r"""
     Category information of a word, 
     represented as `{[key1 value1][key2 value2]...}` in MOR dictionary files.
@@ -339,9 +483,9 @@ class Cat(MorDict_PandasColumn):
     meta : lark.tree.Meta, optional
         Position of the instance is the source file.
         Defaults to `None`.
-    comments : typing.List[Comment], optional
+    comments : typing.Sequence[Comment], optional
         Comments anchored to the instance. 
-        Defaults to an empty list rather than `None`.
+        Defaults to an empty tuple rather than `None`.
     attrvals : typing.Tuple[Cat_AttrVal], optional
         The set of the features and their values.
         Defaults to an empty `Tuple`.
@@ -359,34 +503,110 @@ class Cat(MorDict_PandasColumn):
         type = typing.Tuple[Cat_AttrVal]
     )
 
+    @classmethod
+    def intern(cls, attrvals: typing.Tuple[Cat_AttrVal]) -> "Cat":
+        """
+        Get the category with the given features
+            and neither position nor comments,
+            shared among all the callers as long as it is alive.
+        Many entries in a dictionary share the same category,
+            which then gets serialized only once
+            (see `MorDict_SingleFixedValue.intern`).
+
+        Parameters
+        ----------
+        attrvals : typing.Tuple[Cat_AttrVal]
+            The features.
+
+        Returns
+        -------
+        instance : Cat
+            The shared instance.
+        """
+        key = (cls, attrvals) # type: typing.Tuple[type, typing.Tuple[Cat_AttrVal]]
+        res = _interned_values.get(key)
+
+        if res is None:
+            res = cls(attrvals = attrvals)
+            _interned_values[key] = res
+        # === END IF ===
+
+        return res
+    # === END ===
+
     def dump_mordict(
         self,
         buffer: typing.TextIO,
         with_comments: bool = True
     ) -> typing.NoReturn:
-        buffer.write(self.delimiter_beginning)
-        for attrval in self.attrvals:
-            attrval.dump_mordict(buffer, with_comments)
-        # === END FOR attrval ===
-
-        buffer.write(self.delimiter_end)
+        buffer.write(str(self))
 
-        if with_comments:
-            if self.comments:
-                buffer.write(" ")
-            # === END IF ===
+        if with_comments and self.comments:
+            buffer.write(" ")
 
+            # Comments are all of the same class, 
+            #   whose method is thus looked up only once
+            dump = Comment.dump_mordict
             for c in self.comments:
-                c.dump_mordict(
-                    buffer,
-                    with_comments = True
-                )
+                dump(c, buffer, True)
             # === END FOR c ===
         # === END IF ===
     # === END ===
 
+    def __str__(self) -> str:
+        try:
+            return self._str_cache
+        except AttributeError:
+            res = (
+                self.delimiter_beginning 
+                + "".join(map(str, self.attrvals))
+                + self.delimiter_end
+            ) # type: str
+            # bypass the frozenness just for the memo
+            object.__setattr__(self, "_str_cache", res)
+
+            return res
+        # === END TRY ===
+    # === END ===
+
+    def _get_index(self) -> typing.Dict[str, typing.Tuple[Cat_AttrVal]]:
+        try:
+            return self._index
+        except AttributeError:
+            groups = {} # type: typing.Dict[str, typing.List[Cat_AttrVal]]
+            for av in self.attrvals:
+                groups.setdefault(av.key, []).append(av)
+            # === END FOR av ===
+
+            index = {
+                k: tuple(v) for k, v in groups.items()
+            } # type: typing.Dict[str, typing.Tuple[Cat_AttrVal]]
+            # bypass the frozenness just for the memo
+            object.__setattr__(self, "_index", index)
+
+            return index
+        # === END TRY ===
+    # === END ===
+
     def __getitem__(self, key: str) -> typing.Iterator[Cat_AttrVal]:
-        return filter(lambda item: item.key == key, self.attrvals)
+        return iter(self._get_index().get(key, ()))
+    # === END ===
+
+    def get_all(self, key: str) -> typing.Tuple[Cat_AttrVal]:
+        """
+        Get all the features with the given key at once.
+
+        Parameters
+        ----------
+        key : str
+            The feature name.
+
+        Returns
+        -------
+        attrvals : typing.Tuple[Cat_AttrVal]
+            The features found, possibly empty.
+        """
+        return self._get_index().get(key, ())
     # === END ===
 # === END CLASS ===
 
@@ -402,12 +622,14 @@ class Sem(MorDict_SingleFixedValue, MorDict_PandasColumn):
     meta : lark.tree.Meta, optional
         Position of the instance is the source file.
         Defaults to `None`.
-    comments : typing.List[Comment], optional
+    comments : typing.Sequence[Comment], optional
         Comments anchored to the instance. 
-        Defaults to an empty list rather than `None`.
+        Defaults to an empty tuple rather than `None`.
     value : str
         The english translation.
     """
+    __slots__ = () # keep the instances free of `__dict__`
+
     delimiter_beginning  = "=" # type:    typing.ClassVar[str]
     delimiter_end  = "=" # type:          typing.ClassVar[str]
     is_omittable = True # type:           typing.ClassVar[bool]
@@ -426,24 +648,59 @@ class Gloss(MorDict_SingleFixedValue, MorDict_PandasColumn):
     meta : lark.tree.Meta, optional
         Position of the instance is the source file.
         Defaults to `None`.
-    comments : typing.List[Comment], optional
+    comments : typing.Sequence[Comment], optional
         Comments anchored to the instance. 
-        Defaults to an empty list rather than `None`.
+        Defaults to an empty tuple rather than `None`.
     value : str
         The lemmatization.
     """
+    __slots__ = () # keep the instances free of `__dict__`
+
     delimiter_beginning = '"' # type:    typing.ClassVar[str]  
     delimiter_end  = '"' # type:          typing.ClassVar[str]
     is_omittable = True # type:           typing.ClassVar[bool]
     pandas_col_name  = "Morphological Analysis" # type:        typing.ClassVar[str]
 # === END CLASS ===
 
+Lex_Entry_Tuple = collections.namedtuple(
+    "Lex_Entry_Tuple",
+    ("phon", "cat", "sem", "gloss", "enabled")
+)
+"""
+Non-meta attributes of a `Lex_Entry` as a tuple (see `Lex_Entry.to_tuple`).
+"""
+
+_EMPTY_SEM = Sem.intern("") # type: Sem
+"""
+The empty `Sem` shared by default among `Lex_Entry`s
+    (and kept alive in the table of `MorDict_SingleFixedValue.intern`).
+"""
+
+_EMPTY_GLOSS = Gloss.intern("") # type: Gloss
+"""
+The empty `Gloss` shared by default among `Lex_Entry`s, likewise.
+"""
+
+class _Lex_Entry_Memo(MorDict_Base):
+    """
+    Slots of the memos of `Lex_Entry`, likewise (see `_Cat_AttrVal_Memo`).
+
+    Attributes
+    ----------
+    _tuple : Lex_Entry_Tuple
+        Memo of `to_tuple`.
+    """
+    __slots__ = ("_tuple", )
+# === END CLASS ===
+
 @attr.s(
     cmp = True,
     frozen = True,
+    cache_hash = True, # ingredients hash recursively
+    slots = True,
     #auto_attribs = True
 )
-class Lex_Entry(MorDict_Base):
+class Lex_Entry(_Lex_Entry_Memo):
     r"""
     Word entry in MOR dictionary files.
 
@@ -454,9 +711,9 @@ class Lex_Entry(MorDict_Base):
     meta : lark.tree.Meta, optional
         Position of the instance is the source file.
         Defaults to `None`.
-    comments : typing.List[Comment], optional
+    comments : typing.Sequence[Comment], optional
         Comments anchored to the instance. 
-        Defaults to an empty list rather than `None`.
+        Defaults to an empty tuple rather than `None`.
     phon : Phon
     cat : Cat
     sem : Sem, optional
@@ -489,27 +746,19 @@ class Lex_Entry(MorDict_Base):
     sem = attr.ib(
         cmp = True,
         kw_only = True,
-        factory = lambda: Sem(
-            meta = None, 
-            comments = [], 
-            value = ""
-        ),
+        default = _EMPTY_SEM,
         type = Sem
     )
     gloss = attr.ib(
         cmp = True,
         kw_only = True,
-        factory = lambda: Gloss(
-            meta = None, 
-            comments = [], 
-            value = ""
-        ),
+        default = _EMPTY_GLOSS,
         type = Gloss
     )
     enabled = attr.ib(
         cmp = False,
         kw_only = True,
-        factory = lambda: True,
+        default = True,
         type = bool
     )
 
@@ -521,96 +770,98 @@ class Lex_Entry(MorDict_Base):
         buffer: typing.TextIO,
         with_comments: bool = True
     ) -> typing.NoReturn:
+        # The entry is rendered locally so that its tail can be checked
+        #   without peeking back at `buffer` (which might be STDOUT).
+        entry_buf = _ListBuf() # type: _ListBuf
+
         if self.enabled:
-            self.phon.dump_mordict(buffer, with_comments)
-            buffer.write("\t")
-            self.cat.dump_mordict(buffer, with_comments)
+            # hoisted out of the repeated lookups below
+            write = entry_buf.write
+            sem = self.sem # type: Sem
+            gloss = self.gloss # type: Gloss
 
-            if self.sem.value:
-                buffer.write(" ")
+            self.phon.dump_mordict(entry_buf, with_comments)
+            write("\t")
+            self.cat.dump_mordict(entry_buf, with_comments)
+
+            if sem.value:
+                write(" ")
             # === END IF ===
-            self.sem.dump_mordict(buffer, with_comments)
+            sem.dump_mordict(entry_buf, with_comments)
 
-            if self.gloss.value:
-                buffer.write(" ")
+            if gloss.value:
+                write(" ")
             # === END IF ===
-            self.gloss.dump_mordict(buffer, with_comments)
+            gloss.dump_mordict(entry_buf, with_comments)
         else:
             # discard contents and just dump comments
-            disabled_entry = io.StringIO() # type: io.StringIO 
-
-            self.phon.dump_mordict(disabled_entry, with_comments)
-            buffer.write("\t")
-            self.cat.dump_mordict(disabled_entry, with_comments)
+            parts = [
+                self.phon.print_mordict(with_comments),
+                "\t",
+                self.cat.print_mordict(with_comments),
+            ] # type: typing.List[str]
 
             if self.sem.value:
-                buffer.write(" ")
+                parts.append(" ")
             # === END IF ===
-            self.sem.dump_mordict(disabled_entry, with_comments)
+            parts.append(self.sem.print_mordict(with_comments))
 
             if self.gloss.value:
-                buffer.write(" ")
+                parts.append(" ")
             # === END IF ===
-            self.gloss.dump_mordict(disabled_entry, with_comments)
-
-            disabled_entry_res = disabled_entry.getvalue(
-            ).replace(
-                "\r\n", " "
-            ).replace(
-                "\n", " "
-            ).replace(
-                "\r", " "
-            ) # type: str
+            parts.append(self.gloss.print_mordict(with_comments))
 
-            buffer.writelines(
+            entry_buf.writelines(
                 (
                     "% DISABLED: ",
-                    disabled_entry_res,
+                    "".join(parts).translate(_newline_to_space_table),
                 )
             )
         # === END IF ===
 
-        if with_comments:
+        if with_comments and self.comments:
+            dump = Comment.dump_mordict
             for c in self.comments:
-                c.dump_mordict(
-                    buffer,
-                    with_comments = True
-                )
+                dump(c, entry_buf, True)
             # === END FOR c ===
         # === END IF ===
 
-        if buffer.seekable():
-            buffer.seek(buffer.tell() - 1)
-            last_char = buffer.read() # type: str
-            if last_char not in "\n\r":
-                buffer.write("\n")
-            # === END IF ===
-        else:
-            buffer.write("\n")
+        entry = entry_buf.getvalue() # type: str
+        if entry[-1:] not in ("\n", "\r"):
+            entry += "\n"
         # === END IF ===
+
+        buffer.write(entry)
     dump_mordict.__doc__ = MorDict_Base.dump_mordict.__doc__
     # === END ===
 
     def to_tuple(
         self
-    ) -> typing.Iterator[
-        typing.Union[MorDict_PandasColumn, bool]
-    ]:
+    ) -> "Lex_Entry_Tuple":
         """
         Convert all the non-meta attributes into a tuple
 
         Returns
         ------
-        values: typing.Tuple[Phon, Cat, Sem, Gloss, bool]
-            `phon`, `cat`, `sem`, `gloss` and `enabled`.
+        values: Lex_Entry_Tuple
+            `phon`, `cat`, `sem`, `gloss` and `enabled`,
+            also accessible by their names.
         """
-        return (
-            self.phon,
-            self.cat,
-            self.sem,
-            self.gloss,
-            self.enabled
-        )
+        try:
+            return self._tuple
+        except AttributeError:
+            res = Lex_Entry_Tuple(
+                self.phon,
+                self.cat,
+                self.sem,
+                self.gloss,
+                self.enabled
+            ) # type: Lex_Entry_Tuple
+            # bypass the frozenness just for the memo
+            object.__setattr__(self, "_tuple", res)
+
+            return res
+        # === END TRY ===
     # === END ===
 
     def get_dataframe_index(self, name: str):
@@ -626,12 +877,12 @@ class Lex_Entry(MorDict_Base):
             Line number in the source file, 
             retrived from the `meta` attribute.
             If it is not available, 
-            a negative random integer is assigned instead.
+            a unique negative integer is assigned instead.
         column : int
             Column number in the source file, 
             retrived from the `meta` attribute.
             If it is not available, 
-            a negative random integer is assigned instead.
+            a unique negative integer is assigned instead.
 
         Parameters
         ---------
@@ -647,7 +898,7 @@ class Lex_Entry(MorDict_Base):
         if meta and not meta.empty:
             return (name, meta.line, meta.column)
         else:
-            return (name, _gen_rand_neg(), _gen_rand_neg())
+            return (name, _gen_neg_index(), _gen_neg_index())
     # === END ===
 # === END CLASS ===
 
@@ -681,9 +932,39 @@ pandas_col_names_overt = (
 Fixed list of column names of a MOR dictionary which originally appears in a MOR file.
 """
 
+def _stringify_cells(cells: typing.Iterable[typing.Any]) -> typing.List[str]:
+    """
+    Stringify cells of a MOR dictionary DataFrame,
+        reusing the result for cells equal to one already seen.
+    Cells which turn out to be unhashable 
+        (e.g. ones put in by hand)
+        are just stringified each time.
+    """
+    memo = {} # type: typing.Dict[typing.Any, str]
+    res = [] # type: typing.List[str]
+
+    for cell in cells:
+        try:
+            cell_str = memo.get(cell)
+        except TypeError:
+            res.append(str(cell))
+            continue
+        # === END TRY ===
+
+        if cell_str is None:
+            cell_str = str(cell)
+            memo[cell] = cell_str
+        # === END IF ===
+
+        res.append(cell_str)
+    # === END FOR cell ===
+
+    return res
+# === END ===
+
 def dump_mordict_pandas(
-        df: pd.DataFrame,
-        path_or_buf: typing.Union[str, typing.TextIO], 
+        df: "pd.DataFrame",
+        path_or_buf: typing.Union[str, "os.PathLike", typing.TextIO], 
     ) -> typing.NoReturn:
     """
     Dump a detailed representation of a 
@@ -693,17 +974,121 @@ def dump_mordict_pandas(
     ---------
     df : pd.DataFrame
         MOR dictionary in the Pandas DataFrame form.
-    path_or_buf : typing.Union[str, typing.TextIO]
+    path_or_buf : typing.Union[str, os.PathLike, typing.TextIO]
         Either a path to a file or a writable stream 
         to which the dictionary is dumped.
+        A file is written in UTF-8, as `read_file` reads by default.
+    """
+    if not hasattr(path_or_buf, "write"):
+        # any path-like, as `DataFrame.to_csv` takes
+        with open(path_or_buf, "w", encoding = "utf-8", newline = "") as f:
+            dump_mordict_pandas(df, f)
+        # === END WITH f ===
+
+        return
+    # === END IF ===
+
+    # Rows are fed straight to `csv.writer`
+    #   rather than through the general formatter of `DataFrame.to_csv`.
+    writer = csv.writer(
+        path_or_buf,
+        delimiter = "\t",
+        quoting = csv.QUOTE_NONE,
+        quotechar = None, # as `to_csv` does under `QUOTE_NONE`
+        lineterminator = os.linesep,
+    )
+    writer.writerow(tuple(df.index.names) + pandas_col_names_overt)
+
+    index = (
+        df.index if df.index.nlevels > 1
+        else ((i, ) for i in df.index)
+    ) # type: typing.Iterable[typing.Tuple]
+
+    # Stringify each distinct cell only once 
+    #   instead of cell by cell,
+    #   going through the bare object arrays of the columns.
+    writer.writerows(
+        idx + cells
+        for idx, cells in zip(
+            index,
+            zip(
+                *(
+                    _stringify_cells(df[col].to_numpy())
+                    for col in pandas_col_names_overt
+                )
+            )
+        )
+    )
+# === END ===
+
+def _iter_dataframe_rows(
+    df: "pd.DataFrame"
+) -> typing.Iterator[typing.Tuple[Phon, Cat, Sem, Gloss, bool]]:
+    """
+    Iterate over the rows of a MOR dictionary DataFrame 
+        as plain tuples in the order of `pandas_col_names`.
+    The columns are taken out as lists once and zipped,
+        which spares both a `pd.Series` per row (cf. `df.iterrows`)
+        and the copy of the frame that `df[cols].itertuples` makes.
+    """
+    return zip(*(df[col].tolist() for col in pandas_col_names))
+# === END ===
+
+def cat_features_to_dataframe(df: "pd.DataFrame") -> "pd.DataFrame":
     """
-    df.to_csv(
-        path_or_buf = path_or_buf,
-        columns = pandas_col_names_overt,
-        header = True,
-        index = True,
-        sep = "\t",
-        quoting = csv.QUOTE_NONE
+    Spread the features of the categories of 
+        a MOR dictionary in the Pandas DataFrame form
+        into a long table with one row per feature value,
+        so that entries can be selected by their features
+        with vectorized operations, e.g. ::
+
+            feats = cat_features_to_dataframe(df)
+            df.loc[
+                feats.index[(feats["key"] == "scat") & (feats["value"] == "n")]
+                .unique()
+            ]
+
+    Multiple values of a feature get a row each.
+
+    Parameters
+    ---------
+    df : pd.DataFrame
+        MOR dictionary in the Pandas DataFrame form.
+
+    Returns
+    -------
+    features : pd.DataFrame
+        The features, with the columns `key` and `value`
+            (both categorical)
+            and the index of the entries they belong to.
+    """
+    import pandas as pd
+
+    positions = [] # type: typing.List[int]
+    keys = [] # type: typing.List[str]
+    values = [] # type: typing.List[str]
+
+    for pos, cat in enumerate(df[Cat.pandas_col_name].to_numpy()):
+        for av in cat.attrvals:
+            av_values = (
+                av.value if isinstance(av.value, tuple) 
+                else (av.value, )
+            ) # type: typing.Tuple[str, ...]
+
+            for value in av_values:
+                positions.append(pos)
+                keys.append(av.key)
+                values.append(value)
+            # === END FOR value ===
+        # === END FOR av ===
+    # === END FOR pos, cat ===
+
+    return pd.DataFrame(
+        {
+            "key": pd.Categorical(keys),
+            "value": pd.Categorical(values),
+        },
+        index = df.index.take(positions),
     )
 # === END ===
 
@@ -719,18 +1104,22 @@ class Preamble(MorDict_SingleFixedValue):
     meta : lark.tree.Meta, optional
         Position of the instance is the source file.
         Defaults to `None`.
-    comments : typing.List[Comment], optional
+    comments : typing.Sequence[Comment], optional
         Comments anchored to the instance. 
-        Defaults to an empty list rather than `None`.
+        Defaults to an empty tuple rather than `None`.
     value : str
         The content.
     """
+    __slots__ = () # keep the instances free of `__dict__`
+
     delimiter_beginning = "@" # type: typing.ClassVar[str]
     delimiter_end = "\n" # type: typing.ClassVar[str]
     is_omittable = True # type: typing.ClassVar[bool]
 # === END CLASS ===
 
 @attr.s(
+    # also slotted so that pickling (by attrs) covers all the attributes
+    slots = True,
     #auto_attribs = True
 )
 class Dictionary(MorDict_Base):
@@ -745,8 +1134,8 @@ class Dictionary(MorDict_Base):
         Position of the instance is the source file.
         Defaults to `None`.
     comments : typing.List[Comment], optional
-        Comments anchored to the instance. 
-        Defaults to an empty list rather than `None`.
+        Comments at the beginning of the dictionary.
+        Defaults to an empty list.
     name : str, optional
         Name of the dictionary.
         Defaults to a 7-digit hexadecimal random number.
@@ -757,11 +1146,18 @@ class Dictionary(MorDict_Base):
         List of word entries.
         Defaults to an empty list.
     """
+    comments = attr.ib(
+        cmp = False,
+        kw_only = True,
+        factory = list, # not shared, unlike those of the frozen ingredients
+        type = typing.List["Comment"]
+    )
+
     name = attr.ib(
         cmp = True,
         kw_only = True,
         factory = lambda: "<UNTITLED>{0:0=7X}".format(
-            random.randint(1, 16^7)
+            random.getrandbits(28) # 7 hex digits
         ),
         type = str 
     )
@@ -786,20 +1182,35 @@ class Dictionary(MorDict_Base):
         buffer: typing.TextIO,
         with_comments: bool = True
     ):
-        for item in itertools.chain(
-                self.comments,
-                self.preambles,
-                self.contents
-        ):
-            item.dump_mordict(
-                buffer,
-                with_comments = with_comments
-            )
-        # === END FOR item ===
+        # The whole dictionary is rendered in memory 
+        #   and then written to `buffer` at once
+        buf = _ListBuf() # type: _ListBuf
+
+        for section in (self.comments, self.preambles, self.contents):
+            if not section:
+                # often the case with the leading comments
+                continue
+            # === END IF ===
+
+            # Each section is usually made of a single class,
+            #   whose method is thus looked up only once
+            dump_cls = None # type: typing.Optional[type]
+
+            for item in section:
+                if type(item) is not dump_cls:
+                    dump_cls = type(item)
+                    dump = dump_cls.dump_mordict
+                # === END IF ===
+
+                dump(item, buf, with_comments)
+            # === END FOR item ===
+        # === END FOR section ===
+
+        buffer.write(buf.getvalue())
     dump_mordict.__doc__ = MorDict_Base.dump_mordict.__doc__
     # === END ===
 
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> "pd.DataFrame":
         """
         Convert this dictionary to a Pandas DataFrame.
 
@@ -808,32 +1219,88 @@ class Dictionary(MorDict_Base):
         df : pd.DataFrame
             The Pandas DataFrame.
         """
-        data = (
-            map(
-                lambda lex: tuple(lex.to_tuple()),
-                self.contents
-            )
-        ) # type: typing.Iterator[typing.Tuple[Phon, Cat, Sem, Gloss, bool]]
-        index = (
-            map(
-                lambda lex: tuple(lex.get_dataframe_index(self.name)),
-                self.contents
-            )
-        ) # type: typing.Iterator[typing.Tuple[str, int, int]]
+        return self.build_dataframe(self.name, self.contents)
+    # === END ===
+
+    @staticmethod
+    def build_dataframe(
+        name: str,
+        entries: typing.Iterable[Lex_Entry]
+    ) -> "pd.DataFrame":
+        """
+        Build a Pandas DataFrame out of `Lex_Entry`s.
+        The columns are gathered in a single pass over the entries
+            and handed to Pandas as they are, 
+            which saves Pandas from transposing rows.
+
+        Parameters
+        ---------
+        name : str
+            Name of the dictionary that the entries belong to.
+        entries : typing.Iterable[Lex_Entry]
+            The entries.
+
+        Returns
+        -------
+        df : pd.DataFrame
+            The Pandas DataFrame.
+        """
+        import numpy as np
+        import pandas as pd
+
+        phons = [] # type: typing.List[Phon]
+        cats = [] # type: typing.List[Cat]
+        sems = [] # type: typing.List[Sem]
+        glosses = [] # type: typing.List[Gloss]
+        enableds = [] # type: typing.List[bool]
+        lines = [] # type: typing.List[int]
+        columns = [] # type: typing.List[int]
+
+        for lex in entries:
+            phons.append(lex.phon)
+            cats.append(lex.cat)
+            sems.append(lex.sem)
+            glosses.append(lex.gloss)
+            enableds.append(lex.enabled)
+
+            _, line, column = lex.get_dataframe_index(name)
+            lines.append(line)
+            columns.append(column)
+        # === END FOR lex ===
+
+        # The index is given level by level
+        #   rather than as a list of tuples.
+        # The name is the same all over the dictionary
+        #   and is thus put in as a single-value level 
+        #   without being factorized row by row.
+        positions = pd.MultiIndex.from_arrays(
+            [lines, columns]
+        ) # type: pd.MultiIndex
+        index = pd.MultiIndex(
+            levels = [[name]] + list(positions.levels),
+            codes = (
+                [np.zeros(len(lines), dtype = np.int8)] 
+                + list(positions.codes)
+            ),
+            names = pandas_index_names,
+            verify_integrity = False,
+        ) # type: pd.MultiIndex
 
         return pd.DataFrame(
-            data,
-            columns = pandas_col_names,
-            index = pd.MultiIndex.from_tuples(
-                tuples = index, 
-                names = pandas_index_names
+            dict(
+                zip(
+                    pandas_col_names,
+                    (phons, cats, sems, glosses, enableds)
+                )
             ),
+            columns = pandas_col_names,
+            index = index,
         )
     # === END ===
 
     @staticmethod
     def dataframe_to_entries(
-        df: pd.DataFrame
+        df: "pd.DataFrame"
     ) -> typing.List[Lex_Entry]:
         """
         Convert a Pandas DataFrame back to a list of `Lex_Entry`.
@@ -851,26 +1318,30 @@ class Dictionary(MorDict_Base):
         lexs : typing.List[Lex_Entry]
             List of the lexical entries in the given DataFrame.
         """
+        # The rows are in the order of `Lex_Entry.to_tuple`
         return [
             Lex_Entry(
-                    phon = row[Phon.pandas_col_name],
-                    cat = row[Cat.pandas_col_name],
-                    sem = row[Sem.pandas_col_name],
-                    gloss = row[Gloss.pandas_col_name],
-                    enabled = row["enabled"],
-                    meta = None,
-                    comments = []
+                phon = phon, 
+                cat = cat, 
+                sem = sem, 
+                gloss = gloss, 
+                enabled = enabled
             )
-            for _, row in df.iterrows()
+            for phon, cat, sem, gloss, enabled in _iter_dataframe_rows(df)
         ]
     # === END ===
 
     def update_with_dataframe(
         self, 
-        df: pd.DataFrame
+        df: "pd.DataFrame"
     ) -> typing.NoReturn:
         """
         Overwrite the contents with an external Pandas DataFrame.
+        If the contents are a list, it is updated in place,
+            and the entries that are already there 
+            without position and comments 
+            are kept as they are 
+            if the corresponding row holds the very same cells.
 
         Parameters
         ---------
@@ -878,7 +1349,49 @@ class Dictionary(MorDict_Base):
             MOR dictionary having been converted to a DataFrame. 
     
         """
-        self.contents = self.dataframe_to_entries(df)
+        contents = self.contents # type: typing.List[Lex_Entry]
+
+        if not isinstance(contents, list):
+            self.contents = self.dataframe_to_entries(df)
+            return
+        # === END IF ===
+
+        len_contents = len(contents) # type: int
+
+        res = [] # type: typing.List[Lex_Entry]
+        for i, row in enumerate(_iter_dataframe_rows(df)):
+            if i < len_contents:
+                lex = contents[i] # type: Lex_Entry
+
+                # Entries are frozen and thus cannot be updated,
+                #   but can be shared if nothing changes.
+                # Cells are compared by identity,
+                #   as equality ignores comments.
+                if (
+                    lex.meta is None
+                    and not lex.comments 
+                    and all(
+                        a is b for a, b in zip(lex.to_tuple(), row)
+                    )
+                ):
+                    res.append(lex)
+                    continue
+                # === END IF ===
+            # === END IF ===
+
+            phon, cat, sem, gloss, enabled = row
+            res.append(
+                Lex_Entry(
+                    phon = phon, 
+                    cat = cat, 
+                    sem = sem, 
+                    gloss = gloss, 
+                    enabled = enabled
+                )
+            )
+        # === END FOR i, row ===
+
+        contents[:] = res
     # === END ===
 
     @staticmethod
@@ -886,7 +1399,7 @@ class Dictionary(MorDict_Base):
             comments: typing.List[Comment],
             meta: lark.tree.Meta,
             preambles: typing.List[Preamble],
-            df: pd.DataFrame,
+            df: "pd.DataFrame",
             name: str = ""
     ) -> "Dictionary":
         return Dictionary(
@@ -906,15 +1419,69 @@ class Dictionary(MorDict_Base):
 # ------
 # Auxiliaries
 # ------
-@lark.visitors.v_args(meta = True)
+def _visit_with_meta(
+    f: typing.Callable, 
+    _data: str, 
+    children: typing.List[typing.Any], 
+    meta: typing.Optional[lark.tree.Meta]
+) -> typing.Any:
+    """
+    A visit wrapper passing the children and the meta, 
+        like `v_args(meta = True)`, 
+        but also usable during parsing (`meta` being `None` there).
+    An empty meta is passed as `None` as well,
+        so that `meta` is `None` on any ingredient without a position.
+    """
+    return f(children, None if meta is None or meta.empty else meta)
+# === END ===
+
+def _visit_with_meta_inline(
+    f: typing.Callable, 
+    _data: str, 
+    children: typing.List[typing.Any], 
+    meta: typing.Optional[lark.tree.Meta]
+) -> typing.Any:
+    """
+    The inline version of `_visit_with_meta`, 
+        like `v_args(meta = True, inline = True)`.
+    """
+    return f(None if meta is None or meta.empty else meta, *children)
+# === END ===
+
+def _build_single_value(
+    cls: type,
+    meta: typing.Optional[lark.tree.Meta],
+    value: str,
+    comments: typing.Sequence[Comment]
+) -> MorDict_SingleFixedValue:
+    """
+    Build an instance of a subclass of `MorDict_SingleFixedValue`
+        out of parsed ingredients.
+    It is shared by `MorDict_SingleFixedValue.intern`
+        if there is nothing particular to it,
+        i.e. neither position (parsed without positions) nor comments.
+    """
+    if meta is None and not comments:
+        return cls.intern(value)
+    else:
+        return cls(meta = meta, value = value, comments = comments)
+    # === END IF ===
+# === END ===
+
+@lark.visitors.v_args(wrapper = _visit_with_meta)
 class __Transformer(lark.Transformer):
+    @lark.visitors.v_args(wrapper = _visit_with_meta_inline)
     def start(
             self, 
-            children: typing.Iterator[typing.Any],
-            meta: lark.tree.Meta
+            meta: typing.Optional[lark.tree.Meta],
+            comments: typing.List[Comment],
+            preambles: typing.List[Preamble],
+            contents: typing.List[Lex_Entry]
         ) -> Dictionary:
         return Dictionary(
-            **dict(children), 
+            comments = comments,
+            preambles = preambles,
+            contents = contents,
             meta = meta
         )
     # === EMD ===
@@ -922,109 +1489,112 @@ class __Transformer(lark.Transformer):
     def comments_init(
         self,
         children: typing.Iterator[typing.Any],
-        meta: lark.tree.Meta # to be discarded
-        ) -> typing.Tuple[str, typing.List[Comment]]:
-        return (
-            "comments",
-            children
-        )
+        meta: typing.Optional[lark.tree.Meta] # to be discarded
+        ) -> typing.List[Comment]:
+        return children
     # === EMD ===
 
     def adj_comment(
         self, 
         children: typing.Iterator[typing.Any],
-        meta: lark.tree.Meta
+        meta: typing.Optional[lark.tree.Meta]
         ) -> Comment:
-        return Comment(
-            meta = meta,
-            value = "".join(
-                map(
-                    lambda a: str(a).strip(),
-                    children
-                )
-            ), 
-            comments = []
+        # At most one COMMENT token, as in `"%" COMMENT?`
+        return _build_single_value(
+            Comment,
+            meta,
+            children[0].value.strip() if children else "",
+            _EMPTY_COMMENTS
         )
     # === END ===
 
     def preambles(
         self, 
         children: typing.Iterator[typing.Any],
-        meta: lark.tree.Meta # to be discarded
+        meta: typing.Optional[lark.tree.Meta] # to be discarded
         ) -> typing.List[Preamble]:
-        return ("preambles", children)
+        return children
     # === EMD ===
 
     def entries(self, 
         children: typing.Iterator[typing.Any],
-        meta: lark.tree.Meta # to be discarded
-    ) -> typing.Tuple[str, typing.List[Lex_Entry]]:
-        return ("contents", children)
+        meta: typing.Optional[lark.tree.Meta] # to be discarded
+    ) -> typing.List[Lex_Entry]:
+        return children
     # === END ===
 
+    @lark.visitors.v_args(wrapper = _visit_with_meta_inline)
     def line(
         self, 
-        children: typing.Iterator[typing.Any],
-        meta: lark.tree.Meta
+        meta: typing.Optional[lark.tree.Meta],
+        phon: Phon,
+        cat: Cat,
+        *sem_gloss: typing.Union[Sem, Gloss]
         ) -> Lex_Entry:
+        sem = _EMPTY_SEM # type: Sem
+        gloss = _EMPTY_GLOSS # type: Gloss
+
+        # Either of them can be missing, hence told apart by their classes
+        for item in sem_gloss:
+            if type(item) is Sem:
+                sem = item
+            else:
+                gloss = item
+            # === END IF ===
+        # === END FOR item ===
+
         return Lex_Entry(
-            **dict(children), 
+            phon = phon,
+            cat = cat,
+            sem = sem,
+            gloss = gloss,
             enabled = True,
             meta = meta, 
-            comments = []
+            comments = _EMPTY_COMMENTS
         )
     # === END ===
 
+    @lark.visitors.v_args(wrapper = _visit_with_meta_inline)
     def item_phon(
             self, 
-            children: typing.Iterator[typing.Any],
-            meta: lark.tree.Meta
+            meta: typing.Optional[lark.tree.Meta],
+            phon: lark.Token,
+            *comments: Comment
         ) -> Phon:
-        return (
-            "phon",
-            Phon(
-                meta = meta,
-                value = str(children[0]),
-                comments = children[1:]
-            )
-        )
+        return _build_single_value(Phon, meta, phon.value, comments)
     # === END ===
 
+    @lark.visitors.v_args(wrapper = _visit_with_meta_inline)
     def item_cat_attr(
         self, 
-        children: typing.Iterator[typing.Any],
-        meta: lark.tree.Meta
+        meta: typing.Optional[lark.tree.Meta],
+        attr: lark.Token
     ) -> str:
-        return str(children[0])
+        # Feature names recur in every entry, hence interned
+        return sys.intern(attr.value)
     # === END ===
 
     def item_cat_values(
         self, 
         children: typing.Iterator[typing.Any],
-        meta: lark.tree.Meta
+        meta: typing.Optional[lark.tree.Meta]
     ) -> typing.List[str]:
-        return list(map(str, children))
+        # Feature values (e.g. `n`, `v`) also recur, hence interned
+        return [sys.intern(c.value) for c in children]
     # === END ===
 
+    @lark.visitors.v_args(wrapper = _visit_with_meta_inline)
     def item_cat_attrval(
         self,
-        children: typing.Iterator[typing.Any],
-        meta: lark.tree.Meta
+        meta: typing.Optional[lark.tree.Meta],
+        key: str,
+        vals: typing.List[str],
+        *comments: Comment
     ) -> Cat_AttrVal:
-        key = children[0]
-        vals = children[1]
-        comments = children[2:]
-
-        #val_res: typing.Union[str, typing.List[str]]
-        val_len = len(vals) # type: int
-
-        if val_len == 0:
-            val_res = ""
-        elif val_len == 1:
-            val_res = vals[0]
-        else:
-            val_res = vals
-        # === END IF ===
+        # A single value is unwrapped, no value becomes ""
+        val_res = (
+            vals[0] if len(vals) == 1 else (vals or "")
+        ) # type: typing.Union[str, typing.List[str]]
 
         return Cat_AttrVal(
             key = key,
@@ -1037,93 +1607,85 @@ class __Transformer(lark.Transformer):
     def item_cat_attrval_list(
             self, 
             children: typing.Iterator[typing.Any],
-            meta: lark.tree.Meta
+            meta: typing.Optional[lark.tree.Meta]
     ) -> typing.Tuple[Cat_AttrVal]:
         return tuple(children)
     # === END ===
 
+    @lark.visitors.v_args(wrapper = _visit_with_meta_inline)
     def item_cat(
             self, 
-            children: typing.Iterator[typing.Any],
-            meta: lark.tree.Meta
+            meta: typing.Optional[lark.tree.Meta],
+            attrval_list: typing.Tuple[Cat_AttrVal],
+            *comments: Comment
     ) -> Cat:
-        attrval_list = children[0] # type: typing.Tuple[Cat_AttrVal] 
-        comments = children[1:] # type: typing.List[Comment]
-
-        return (
-            "cat", 
-            Cat(
-                meta = meta,
-                comments = comments,
-                attrvals = attrval_list
-            )
+        if (
+            meta is None and not comments 
+            and not any(av.comments for av in attrval_list)
+        ):
+            # nothing particular to this category
+            return Cat.intern(attrval_list)
+        # === END IF ===
+
+        return Cat(
+            meta = meta,
+            comments = comments,
+            attrvals = attrval_list
         )
     # === END ===
 
     def item_sem(
             self, 
             children: typing.Iterator[typing.Any],
-            meta: lark.tree.Meta
+            meta: typing.Optional[lark.tree.Meta]
         ) -> Sem:
         res_str = "" # type: str
-        comments = [] # type: typing.List[Comment]
+        comments = _EMPTY_COMMENTS # type: typing.Sequence[Comment]
 
         if len(children) > 0:
             init_arg = children[0] # type: lark.Token  
 
             if isinstance(init_arg, lark.Token) and init_arg.type == "SEM":
-                res_str = str(init_arg)
-                comments = children[1:]
+                res_str = init_arg.value
+                comments = tuple(children[1:])
             # === END IF ===
         # === END IF ===
 
-        return (
-            "sem", 
-            Sem(
-                meta = meta,
-                value = res_str, 
-                comments = comments
-            )
-        )
+        return _build_single_value(Sem, meta, res_str, comments)
     # === END ===
 
     def item_gloss(
             self, 
             children: typing.Iterator[typing.Any],
-            meta: lark.tree.Meta
+            meta: typing.Optional[lark.tree.Meta]
         ) -> Gloss:
         res_str = "" # type: str
-        comments = [] # type: typing.List[Comment]
+        comments = _EMPTY_COMMENTS # type: typing.Sequence[Comment]
 
         if len(children) > 0:
             init_arg = children[0] # type: lark.Token
 
             if init_arg.type == "GLOSS":
-                res_str = str(init_arg)
-                comments = children[1:]
+                res_str = init_arg.value
+                comments = tuple(children[1:])
             # === END IF ===
         # === END IF ===
     # === END IF ===
 
-        return (
-            "gloss",
-            Gloss(
-                meta = meta,
-                value = res_str, 
-                comments = comments
-            )
-        )
+        return _build_single_value(Gloss, meta, res_str, comments)
     # === END ===
 
+    @lark.visitors.v_args(wrapper = _visit_with_meta_inline)
     def item_preamble(
         self, 
-        children: typing.Iterator[typing.Any],
-        meta: lark.tree.Meta
+        meta: typing.Optional[lark.tree.Meta],
+        preamble: lark.Token,
+        *comments: Comment
         ) -> Preamble:
         return Preamble(
             meta = meta,
-            value = str(children[0]),
-            comments = children[1:]
+            value = preamble.value,
+            comments = comments
         )
     # === END ===
 # === END CLASS ===
@@ -1199,19 +1761,124 @@ start:          _EOL* comments_init preambles _EOL* entries _EOL*
     """
 ) # type: str
 
-parser = lark.Lark(
-    grammar = _grammar,
-    parser = "lalr",
-    propagate_positions = True,
-) # type: lark.Lark 
+_cache_names = {
+    True: "mordict.larkcache",
+    False: "mordict-nopos.larkcache",
+} # type: typing.Dict[bool, str]
 """
-A Lark parser for MOR dictionary files.
+Names of the files in which the LALR tables of `parsers` are cached,
+    one for each setting of `with_positions`.
+"""
+
+parsers = {} # type: typing.Dict[typing.Tuple[bool, bool], lark.Lark]
+"""
+Lark parsers for MOR dictionary files, 
+    keyed by whether positions are propagated
+    and whether the transformer is applied during parsing.
+Each is built at the first call of `get_parser`,
+    so that those who do not parse do not pay for it.
 """
 
 # ------
 # Executor
 # ------
-def parse_raw(text: str) -> lark.Tree:
+def get_parser(
+    with_positions: bool = False,
+    transform: bool = False
+) -> lark.Lark:
+    """
+    Get the Lark parser for MOR dictionary files.
+
+    Parameters
+    ---------
+    with_positions : bool, optional
+        If `True`, the parser records the positions of all the nodes
+            in their `meta`, at the cost of speed.
+        Defaults to `False`.
+    transform : bool, optional
+        If `True`, the parser builds `Dictionary` directly
+            by applying the transformer at each reduction,
+            never building the whole tree.
+        Not available with `with_positions`,
+            as Lark does not give positions to such transformers.
+        Defaults to `False`.
+
+    Returns
+    -------
+    parser : lark.Lark
+        The parser.
+    """
+    if with_positions and transform:
+        raise ValueError(
+            "Positions cannot be propagated to the transformer during parsing"
+        )
+    # === END IF ===
+
+    key = (with_positions, transform) # type: typing.Tuple[bool, bool]
+    res = parsers.get(key) # type: typing.Optional[lark.Lark]
+
+    if res is None:
+        # The transformer does not take part in the cache,
+        #   which is thus shared
+        res = _larkutil.build_parser(
+            _cache_names[with_positions],
+            grammar = _grammar,
+            parser = "lalr",
+            propagate_positions = with_positions,
+            transformer = (__transformer_instance if transform else None),
+        )
+        parsers[key] = res
+    # === END IF ===
+
+    return res
+# === END ===
+
+parser = _larkutil.Lazy_Parser(
+    lambda: get_parser(with_positions = True)
+) # type: _larkutil.Lazy_Parser
+"""
+A Lark parser for MOR dictionary files, 
+    propagating positions as it used to,
+    built at its first use.
+Deprecated: use `get_parser` instead.
+"""
+
+def read_file(path: str, encoding: str = "utf-8") -> str:
+    """
+    Read the whole content of a MOR dictionary file.
+    The file is memory-mapped and decoded in one go
+    rather than being copied through the buffers of `read()`.
+
+    Parameters
+    ---------
+    path : str
+        Path to the file.
+    encoding : str, optional
+        Encoding of the file.
+        Defaults to `"utf-8"`.
+
+    Returns
+    -------
+    text : str
+        The content of the file.
+
+    See Also
+    --------
+    parse
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # empty files cannot be mapped
+            return ""
+        # === END IF ===
+
+        with mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ) as mm:
+            return str(mm, encoding)
+        # === END WITH mm ===
+    # === END WITH f ===
+# === END ===
+
+def parse_raw(text: str, with_positions: bool = False) -> lark.Tree:
     """
     Parse a MOR dicionary file and return a raw Lark Tree.
 
@@ -1219,6 +1886,9 @@ def parse_raw(text: str) -> lark.Tree:
     ---------
     text : str
         Source text.
+    with_positions : bool, optional
+        If `True`, the positions of the nodes are recorded in their `meta`.
+        Defaults to `False`.
     
     Returns
     -------
@@ -1229,10 +1899,14 @@ def parse_raw(text: str) -> lark.Tree:
     --------
     parse
     """
-    return parser.parse(text)
+    return get_parser(with_positions).parse(text)
 # === END ===
 
-def parse(name: str, text: str) -> Dictionary:
+def parse(
+    name: str, 
+    text: str, 
+    with_positions: bool = False
+) -> Dictionary:
     """
     Parse a MOR dicionary file and return a structured Python object.
 
@@ -1242,6 +1916,12 @@ def parse(name: str, text: str) -> Dictionary:
         Name of the source file or stream.
     text : str
         Source text.
+    with_positions : bool, optional
+        If `True`, the ingredients get their positions in the source
+            in `meta` (and thereby in the DataFrame index).
+        Otherwise their `meta` is left `None`,
+            which makes parsing faster.
+        Defaults to `False`.
     
     Returns
     -------
@@ -1252,7 +1932,83 @@ def parse(name: str, text: str) -> Dictionary:
     --------
     parse_raw
     """
-    res = __transformer_instance.transform(parse_raw(text)) # type: Dictionary
+    if with_positions:
+        res = __transformer_instance.transform(
+            parse_raw(text, True)
+        ) # type: Dictionary
+    else:
+        # in a single pass without the whole tree
+        res = get_parser(transform = True).parse(text)
+    # === END IF ===
+
     res.name = name
     return res
+# === END ===
+
+def _parse_source(
+    source: typing.Tuple[str, str, bool]
+) -> Dictionary:
+    """
+    Parse a MOR dictionary given as a triple of its name, its text
+        and whether to propagate positions.
+    Defined at the module level so that it can be sent to worker processes.
+    """
+    name, text, with_positions = source
+    return parse(name, text, with_positions)
+# === END ===
+
+def parse_many(
+    sources: typing.Iterable[typing.Tuple[str, str]],
+    with_positions: bool = False,
+    max_workers: typing.Optional[int] = None
+) -> typing.List[Dictionary]:
+    """
+    Parse multiple MOR dictionary files in parallel.
+    Parsing is CPU-bound and holds the GIL,
+        so the files are shared out to worker processes
+        rather than threads.
+
+    Parameters
+    ---------
+    sources : typing.Iterable[typing.Tuple[str, str]]
+        Pairs of the name and the text of each source file.
+    with_positions : bool, optional
+        See `parse`.
+        Defaults to `False`.
+    max_workers : int, optional
+        Number of the worker processes.
+        If `1`, the files are parsed one by one in this process,
+            with the parser already built here,
+            which saves starting workers and pickling the results
+            for small batches.
+        Defaults to `None`, leaving it for `concurrent.futures` to decide.
+
+    Returns
+    -------
+    dictionaries : typing.List[Dictionary]
+        The Python objects representing the input texts, in the same order.
+
+    See Also
+    --------
+    parse
+    """
+    if max_workers == 1:
+        return [
+            parse(name, text, with_positions) for name, text in sources
+        ]
+    # === END IF ===
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers = max_workers
+    ) as executor:
+        return list(
+            executor.map(
+                _parse_source,
+                (
+                    (name, text, with_positions)
+                    for name, text in sources
+                )
+            )
+        )
+    # === END WITH executor ===
 # === END ===
\ No newline at end of file